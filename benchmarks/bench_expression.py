@@ -0,0 +1,67 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Compare the per-fire cost of PulledFrom expressions evaluated from their
+source text and from their precompiled code objects.
+"""
+
+import os
+import sys
+import timeit
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+from traits.api import Any, Float, HasTraits
+
+from qt_binder.binder import Binder
+from qt_binder.binding import PulledFrom, compile_expression
+
+
+EXPRESSION = "'{0:.2f} {1}'.format(object.value * object.scale, object.units)"
+
+
+class Model(HasTraits):
+    value = Float(1.0)
+    scale = Float(2.5)
+    units = Any('m')
+
+
+class Label(Binder):
+    text = Any()
+
+
+def main(number=20000):
+    model = Model()
+    context = {'object': model}
+    code = compile_expression(EXPRESSION)
+    source = min(timeit.repeat(lambda: eval(EXPRESSION, context),
+                               number=number, repeat=5))
+    compiled = min(timeit.repeat(lambda: eval(code, context),
+                                 number=number, repeat=5))
+
+    label = Label()
+    binding = PulledFrom('text', EXPRESSION)
+    binding.bind(label, context)
+    values = iter(range(10 ** 9))
+
+    def fire():
+        model.value = next(values)
+
+    bound = min(timeit.repeat(fire, number=number, repeat=5))
+    binding.unbind()
+
+    print('{0} evaluations of {1}'.format(number, EXPRESSION))
+    print('  eval(source):       {0:.2f} us'.format(source / number * 1e6))
+    print('  eval(code):         {0:.2f} us ({1:.1f}x)'.format(
+        compiled / number * 1e6, source / compiled))
+    print('  PulledFrom change:  {0:.2f} us'.format(bound / number * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Compare repeated QtProperty reads with and without the value cache.
+"""
+
+import os
+import sys
+import timeit
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+from qt_binder.binder import Binder
+from qt_binder.qt import QtGui
+
+
+class LineEdit(Binder):
+    qclass = QtGui.QLineEdit
+
+
+class CachedLineEdit(Binder):
+    qclass = QtGui.QLineEdit
+    cached_qt_properties = frozenset(['text'])
+
+
+def bench(binder_class, number):
+    binder = binder_class()
+    binder.construct()
+    binder.qobj.setText(u'Some text')
+    return min(timeit.repeat(lambda: binder.text, number=number, repeat=5))
+
+
+def main(number=100000):
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])  # noqa
+    uncached = bench(LineEdit, number)
+    cached = bench(CachedLineEdit, number)
+    print('{0} reads of LineEdit.text'.format(number))
+    print('  uncached: {0:.3f} s'.format(uncached))
+    print('  cached:   {0:.3f} s ({1:.1f}x)'.format(cached, uncached / cached))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,169 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Measure the cost of connecting Traits listeners to Qt signals.
+
+Reports the Python memory allocated per Binder for the connections and the
+time to connect and disconnect the listeners. To compare with another
+revision, e.g. the one before a change to the signal dispatcher::
+
+    python benchmarks/bench_signal_dispatch.py --baseline <rev>
+
+The script is then also run against a copy of that revision.
+
+Some PySide versions drop a reference to ``True`` on every signal disconnect,
+and the interpreter aborts once none are left. On those, the script times as
+many rounds as the remaining references safely allow, which may be fewer than
+asked for, and exits without the interpreter's cleanup.
+"""
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# The tree to import qt_binder from; --tree overrides it.
+TREE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+if '--tree' in sys.argv:
+    TREE = sys.argv[sys.argv.index('--tree') + 1]
+sys.path.insert(0, TREE)  # noqa
+
+from qt_binder.binder import Binder
+from qt_binder.qt import QtGui
+
+
+class LineEdit(Binder):
+    qclass = QtGui.QLineEdit
+
+
+#: The traits listened to on each Binder. 'text' and 'textChanged' share the
+#: same Qt signal.
+NAMES = ['text', 'textChanged', 'textEdited', 'returnPressed',
+         'editingFinished', 'cursorPositionChanged']
+
+
+def handler():
+    pass
+
+
+def make_binders(n):
+    binders = []
+    for i in range(n):
+        binder = LineEdit()
+        binder.construct()
+        binders.append(binder)
+    return binders
+
+
+def connect(binders):
+    for binder in binders:
+        for name in NAMES:
+            binder.on_trait_change(handler, name)
+
+
+def disconnect(binders):
+    for binder in binders:
+        for name in NAMES:
+            binder.on_trait_change(handler, name, remove=True)
+
+
+def run_baseline(rev, n):
+    """ Run this script against a copy of another revision.
+    """
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    tmpdir = tempfile.mkdtemp()
+    try:
+        archive = subprocess.check_output(
+            ['git', 'archive', rev, 'qt_binder'], cwd=repo)
+        subprocess.run(['tar', '-x', '-C', tmpdir], input=archive,
+                       check=True)
+        return subprocess.check_output(
+            [sys.executable, os.path.abspath(__file__), '--tree', tmpdir,
+             '-n', str(n)], universal_newlines=True)
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+def bench(n, repeat=7):
+    """ Print the measurements for ``n`` binders.
+
+    Returns whether the disconnects leaked references to ``True``.
+    """
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])  # noqa
+    binders = make_binders(n)
+    # Warm up the traits machinery.
+    connect(binders[:1])
+    disconnect(binders[:1])
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    connect(binders)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    true_references = sys.getrefcount(True)
+    disconnect(binders)
+    leaked = true_references - sys.getrefcount(True)
+    if leaked > 0:
+        # Keep half of the remaining references to True for the rest of the
+        # process.
+        affordable = sys.getrefcount(True) // 2 // leaked
+        if affordable < repeat:
+            print('PySide leaks a reference to True per disconnect: timing '
+                  '{0} of {1} rounds'.format(affordable, repeat))
+            repeat = affordable
+
+    # Time without tracemalloc, keeping the best of a few rounds.
+    connect_time = disconnect_time = float('inf')
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        connect(binders)
+        t1 = time.perf_counter()
+        disconnect(binders)
+        t2 = time.perf_counter()
+        connect_time = min(connect_time, t1 - t0)
+        disconnect_time = min(disconnect_time, t2 - t1)
+
+    print('{0} binders with {1} listened traits each'.format(n, len(NAMES)))
+    print('  memory:     {0:.0f} bytes per binder'.format(
+        (after - before) / float(n)))
+    if repeat:
+        print('  connect:    {0:.1f} us per binder'.format(
+            connect_time / n * 1e6))
+        print('  disconnect: {0:.1f} us per binder'.format(
+            disconnect_time / n * 1e6))
+    return leaked > 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('-n', type=int, default=20,
+                        help='The number of binders.')
+    parser.add_argument('--baseline',
+                        help='A git revision to compare with.')
+    parser.add_argument('--tree', help='The tree to import qt_binder from.')
+    args = parser.parse_args(argv)
+    if args.baseline:
+        print('Baseline {0}:'.format(args.baseline))
+        sys.stdout.write(run_baseline(args.baseline, args.n))
+        print('This tree:')
+    sys.stdout.flush()
+    if bench(args.n):
+        # Freeing the objects at exit would release the leaked references to
+        # True and abort the interpreter.
+        sys.stdout.flush()
+        os._exit(0)
+
+
+if __name__ == '__main__':
+    main()
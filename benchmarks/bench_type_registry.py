@@ -0,0 +1,67 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Compare looking up the Binders of many widgets in the binder registry
+with and without its resolution cache, and in a frozen snapshot of it.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+from qt_binder.qt import QtGui
+from qt_binder.raw_widgets import binder_registry
+
+
+class NameField(QtGui.QLineEdit):
+    # An application subclass that is not registered itself.
+    pass
+
+
+WIDGET_CLASSES = [
+    QtGui.QLabel, QtGui.QLineEdit, QtGui.QPushButton, QtGui.QCheckBox,
+    QtGui.QSpinBox, QtGui.QComboBox, QtGui.QCommandLinkButton, NameField,
+]
+
+
+def bench(lookup, widgets):
+    times = []
+    for _ in range(5):
+        start = time.perf_counter()
+        for widget in widgets:
+            lookup(widget)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(n=10000):
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])  # noqa
+    widgets = [WIDGET_CLASSES[i % len(WIDGET_CLASSES)]()
+               for i in range(n)]
+
+    def uncached(widget):
+        # The resolution as it was done on every lookup before the cache.
+        return binder_registry._resolve(type(widget))[-1]
+
+    walked = bench(uncached, widgets)
+    cached = bench(binder_registry.lookup, widgets)
+    frozen = bench(binder_registry.freeze().lookup, widgets)
+
+    print('Looking up the Binders of {0} widgets'.format(n))
+    print('  MRO walk:  {0:.2f} ms'.format(walked * 1e3))
+    print('  cached:    {0:.2f} ms ({1:.1f}x)'.format(
+        cached * 1e3, walked / cached))
+    print('  frozen:    {0:.2f} ms ({1:.1f}x)'.format(
+        frozen * 1e3, walked / frozen))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Compare building many instances of a `.ui` form with the Qt loader and
+from its compiled template.
+"""
+
+import os
+import sys
+import time
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))  # noqa
+
+from qt_binder.qt import QtGui
+from qt_binder.qt.ui_loader import _load_ui_uncached, clear_ui_templates, \
+    load_ui
+
+
+FORM = os.path.join(os.path.dirname(__file__), '..', 'qt_binder', 'tests',
+                    'form.ui')
+
+
+def bench(load, n):
+    start = time.perf_counter()
+    uis = [load(FORM)[0] for _ in range(n)]
+    elapsed = time.perf_counter() - start
+    for ui in uis:
+        ui.deleteLater()
+    return elapsed
+
+
+def main(n=200):
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])  # noqa
+    loaded = bench(_load_ui_uncached, n)
+
+    clear_ui_templates()
+    start = time.perf_counter()
+    load_ui(FORM)
+    compiled = time.perf_counter() - start
+    replayed = bench(load_ui, n)
+
+    print('Building {0} instances of {1}'.format(n, os.path.basename(FORM)))
+    print('  Qt loader:   {0:.2f} ms'.format(loaded * 1e3))
+    print('  template:    {0:.2f} ms ({1:.1f}x), after compiling it once in '
+          '{2:.2f} ms'.format(replayed * 1e3, loaded / replayed,
+                              compiled * 1e3))
+
+
+if __name__ == '__main__':
+    main()
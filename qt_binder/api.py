@@ -13,6 +13,6 @@
 from __future__ import absolute_import
 
 from .binder import Binder, Default, QtDynamicProperty, QtProperty, QtSignal, \
-    QtSlot, QtTrait, Rename
+    QtSlot, QtTrait, RateLimit, Rename
 from .bound_editor import Bound, TraitsUI
 from .binding import Factory
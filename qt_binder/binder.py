@@ -9,89 +9,311 @@
 # Thanks for using Enthought open source!
 
 from collections import defaultdict, deque
-import keyword
+from contextlib import contextmanager
+import enum
+import functools
+import operator
+import time
 import weakref
 
 import six
 
-from traits.api import HasStrictTraits, Instance, List, Property, Str, \
-    TraitType, Undefined
+from traits.api import ComparisonMode, HasStrictTraits, Instance, List, \
+    Property, Str, TraitType, Undefined
 
-from .constants import DELAYED_CONNECTION, DELAYED_SETATTR, \
-    EXISTING_INSTANCE_TRAIT, EXISTING_NOTIFIERS, FORCE_INSTANCE_TRAIT, \
-    FORCE_NOTIFIERS
+from .constants import BATCH_STATE, BATCHED_SETATTR, DELAYED_CONNECTION, \
+    DELAYED_SETATTR, EXISTING_INSTANCE_TRAIT, EXISTING_NOTIFIERS, \
+    FORCE_INSTANCE_TRAIT, FORCE_NOTIFIERS, PROPERTY_CACHE, RATE_LIMITS, \
+    SIGNAL_DISPATCHER
+from .introspection import _python_name_for_qt_name, \
+    _qt_name_for_meta_method, _setter_name, _to_str, get_class_info
 from .loopback_guard import LoopbackGuard
-from .qt import QtCore, qt_api
+from .qt import QtCore, QtGui, qt_api
+from .restyle import restyle_scheduler
+from .static_traits import load_static_qt_traits
 
 
 NULL_VARIANT_VALUES = {
     'QString': u'',
 }
 
+#: The commonly used members of ``QWidget``, to extend
+#: :attr:`~.Binder.qt_trait_names` with.
+QWIDGET_BASICS = (
+    'objectName', 'destroyed', 'deleteLater',
+    'enabled', 'setEnabled', 'visible', 'setVisible', 'show', 'hide',
+    'setFocus', 'update', 'focusPolicy',
+    'toolTip', 'statusTip', 'whatsThis', 'styleSheet', 'font',
+    'geometry', 'minimumSize', 'maximumSize', 'sizePolicy',
+    'customContextMenuRequested',
+)
 
-def _to_str(t, encoding='ascii'):
-    if isinstance(t, QtCore.QByteArray):
-        t = t.data().decode(encoding)
-    else:
-        t = str(t)
-    return t
 
+def _disconnect(signal, slot):
+    # FIXME: PySide2 will raise a RuntimeError here, but it will disconnect
+    # the signal. Not sure if there are other problems.
+    try:
+        signal.disconnect(slot)
+    except RuntimeError:
+        if qt_api not in ('pyside2', 'pyside6'):
+            raise
 
-def _slot_name(name):
-    return '_{}_property_changed'.format(name)
 
+#: The names of the rate limiting metadata of QtTraits.
+RATE_LIMIT_KEYS = ('throttle', 'debounce', 'latest_only')
 
-def _slot_for(ref, name):
-    def slot(*args):
-        obj = ref()
-        if obj is not None:
-            if len(args) == 1:
-                args = args[0]
-            obj.trait_property_changed(name, Undefined, args)
-    slot.__name__ = _slot_name(name)
-    return slot
+_NOTHING = object()
 
 
-def _guard_against_null_variant(value):
-    """ Convert PyQt4's QPyNullVariant to a reasonable value.
+class _RateLimiter(object):
+    """ Deliver the values of a high-frequency signal at a limited rate.
+
+    With ``debounce``, a value is delivered once no new value has come for
+    that many milliseconds. With ``throttle``, a value is delivered
+    immediately, then at most once every that many milliseconds. With
+    ``latest_only``, the values are delivered once per iteration of the event
+    loop. In all cases, the last value is always delivered.
     """
-    if type(value).__name__ == 'QPyNullVariant':
-        return NULL_VARIANT_VALUES.get(value.typeName(), None)
-    return value
 
+    __slots__ = ('deliver', 'throttle', 'debounce', 'timer', 'pending',
+                 'last_time')
+
+    def __init__(self, deliver, throttle=None, debounce=None,
+                 latest_only=False):
+        self.deliver = deliver
+        self.throttle = throttle
+        self.debounce = debounce
+        self.timer = QtCore.QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+        self.pending = _NOTHING
+        self.last_time = None
+
+    def __call__(self, value):
+        self.pending = value
+        if self.debounce is not None:
+            self.timer.start(int(self.debounce))
+        elif self.throttle is not None:
+            if self.timer.isActive():
+                return
+            elapsed = 0.0
+            if self.last_time is not None:
+                elapsed = (time.perf_counter() - self.last_time) * 1000.0
+            if self.last_time is None or elapsed >= self.throttle:
+                self.flush()
+            else:
+                self.timer.start(int(self.throttle - elapsed))
+        elif not self.timer.isActive():
+            self.timer.start(0)
+
+    def flush(self):
+        """ Deliver the pending value now, if any.
+        """
+        self.timer.stop()
+        value = self.pending
+        if value is not _NOTHING:
+            self.pending = _NOTHING
+            self.last_time = time.perf_counter()
+            self.deliver(value)
+
+    def cancel(self):
+        """ Drop the pending value.
+        """
+        self.timer.stop()
+        self.pending = _NOTHING
 
-def _python_name_for_qt_name(qname):
-    """ Convert forbidden Qt names to valid Python names, following PySide/PyQt
-    rules.
 
-    E.g. 'raise' -> 'raise_'
+class _Connection(object):
+    """ The traits using one Qt signal of a Binder.
+
+    The bound :meth:`dispatch` method is the slot connected to the signal.
     """
-    if keyword.iskeyword(qname):
-        qname += '_'
-    return qname
 
+    __slots__ = ('ref', 'listened', 'cached_names', 'limiters', '__weakref__')
+
+    def __init__(self, ref):
+        self.ref = ref
+
+        #: The names of the traits listening to the signal.
+        self.listened = []
+
+        #: The names of the properties whose cached value the signal drops,
+        #: and the rate limiters of listened names, if any.
+        self.cached_names = None
+        self.limiters = None
 
-def _get_signature(meta_meth):
-    """ Robustly find the signature of a ``QMetaMethod``.
+    def dispatch(self, *args):
+        obj = self.ref()
+        if obj is None:
+            return
+        if self.cached_names:
+            # Drop the stale values before the listeners can read them.
+            cache = obj.__dict__.get(PROPERTY_CACHE)
+            if cache:
+                for name in self.cached_names:
+                    cache.pop(name, None)
+        if self.listened:
+            if len(args) == 1:
+                args = args[0]
+            limiters = self.limiters
+            for name in list(self.listened):
+                limiter = limiters.get(name) if limiters else None
+                if limiter is not None:
+                    limiter(args)
+                else:
+                    obj.trait_property_changed(name, Undefined, args)
+
+    def cancel_limiters(self):
+        if self.limiters:
+            for limiter in self.limiters.values():
+                limiter.cancel()
+
+
+class _SignalDispatcher(object):
+    """ Own the Qt signal connections of a Binder.
+
+    Each Qt signal is connected once, however many traits use it, and its
+    emissions are routed to the traits listening to it and to the property
+    values cached from it.
     """
-    if hasattr(meta_meth, 'methodSignature'):
-        signature = meta_meth.methodSignature()
-    else:
-        signature = meta_meth.signature()
-    signature = _to_str(signature)
-    return signature
 
+    __slots__ = ('ref', 'connections')
+
+    def __init__(self, binder):
+        self.ref = weakref.ref(binder)
+
+        #: Map the signal accessors to their _Connection.
+        self.connections = {}
+
+    def connect(self, qobj, trait, name, cached=False):
+        """ Route the signal of a trait to the trait's listeners, or to drop
+        the cached value of the trait.
+        """
+        key = trait.signal_accessor
+        connection = self.connections.get(key)
+        if connection is None:
+            connection = self.connections[key] = _Connection(self.ref)
+            trait._get_signal(qobj).connect(connection.dispatch)
+        if cached:
+            if connection.cached_names is None:
+                connection.cached_names = []
+            if name not in connection.cached_names:
+                connection.cached_names.append(name)
+        elif name not in connection.listened:
+            connection.listened.append(name)
+            self._set_limiter(connection, name)
+
+    def update_rate_limit(self, trait, name):
+        """ Apply the current rate limit of a listened trait.
+        """
+        connection = self.connections.get(trait.signal_accessor)
+        if connection is not None and name in connection.listened:
+            self._set_limiter(connection, name)
+
+    def disconnect(self, qobj, trait, name, cached=False):
+        """ Stop routing the signal of a trait.
 
-def _qt_name_for_meta_method(meta_meth):
-    """ Get the Qt name for a ``QMetaMethod``.
+        The Qt signal is disconnected once nothing uses it anymore.
+        """
+        key = trait.signal_accessor
+        connection = self.connections.get(key)
+        if connection is None:
+            return
+        if cached:
+            if connection.cached_names and name in connection.cached_names:
+                connection.cached_names.remove(name)
+        elif name in connection.listened:
+            connection.listened.remove(name)
+            if connection.limiters and name in connection.limiters:
+                connection.limiters.pop(name).cancel()
+        if not connection.listened and not connection.cached_names:
+            del self.connections[key]
+            _disconnect(trait._get_signal(qobj), connection.dispatch)
+
+    def disconnect_all(self, qobj):
+        """ Disconnect all of the Qt signals.
+        """
+        connections = self.connections
+        self.connections = {}
+        for (signal_name, key), connection in connections.items():
+            connection.cancel_limiters()
+            signal = getattr(qobj, signal_name)
+            if key is not None:
+                signal = signal[key]
+            _disconnect(signal, connection.dispatch)
+
+    def _set_limiter(self, connection, name):
+        limiters = connection.limiters
+        if limiters:
+            old = limiters.pop(name, None)
+            if old is not None:
+                old.flush()
+        limits = self.ref()._rate_limit_for(name)
+        if limits:
+            if limiters is None:
+                limiters = connection.limiters = {}
+            limiters[name] = _RateLimiter(
+                functools.partial(self._deliver, name), **limits)
+
+    def _deliver(self, name, value):
+        obj = self.ref()
+        if obj is not None:
+            obj.trait_property_changed(name, Undefined, value)
+
+
+def _signal_accessor(qname, meta_method):
+    """ Return the Python name of a Qt signal and the key selecting its
+    overload, or None if it takes no arguments.
     """
-    return _get_signature(meta_meth).split('(')[0]
+    arg_types = tuple(_to_str(arg) for arg in meta_method.parameterTypes())
+    return _python_name_for_qt_name(qname), arg_types or None
 
 
-def _setter_name(getter_name):
-    """ Convert a getter name to a setter name.
+def _equal(a, b):
+    """ Whether two values are the same, without failing on values whose
+    comparison does not give a single truth value.
     """
-    return 'set' + getter_name[0].upper() + getter_name[1:]
+    if a is b:
+        return True
+    try:
+        return bool(a == b)
+    except Exception:
+        # E.g. arrays, whose comparisons are not a single truth value.
+        return False
+
+
+#: The functions telling whether two values of a Qt property are equal, by the
+#: type of the values. Enum members are compared with ``==`` and other types
+#: with a guarded ``==``.
+VALUE_COMPARATORS = {
+    bool: operator.eq,
+    int: operator.eq,
+    float: operator.eq,
+    str: operator.eq,
+    QtGui.QColor: operator.eq,
+    QtGui.QFont: operator.eq,
+}
+
+
+def _comparator_for(typ):
+    comparator = VALUE_COMPARATORS.get(typ)
+    if comparator is None:
+        # Other types are not added to the table, which would then grow with
+        # every type of value seen.
+        if issubclass(typ, enum.Enum):
+            # The == of enum members cannot fail, so it needs no guard.
+            comparator = operator.eq
+        else:
+            comparator = _equal
+    return comparator
+
+
+def _guard_against_null_variant(value):
+    """ Convert PyQt4's QPyNullVariant to a reasonable value.
+    """
+    if type(value).__name__ == 'QPyNullVariant':
+        return NULL_VARIANT_VALUES.get(value.typeName(), None)
+    return value
 
 
 class QtTrait(TraitType):
@@ -102,9 +324,10 @@ class QtTrait(TraitType):
 
     If there is a Qt ``Signal`` that should be connected to to propagate
     notifications, set ``is_signal`` to ``True`` and provide a ``qname`` (the
-    Qt name for the signal) and ``meta_method`` (the ``QMetaMethod`` for the
-    signal). The Qt ``Signal`` will only be connected to when a Traits listener
-    is attached to this trait.
+    Qt name for the signal), ``meta_method`` (the ``QMetaMethod`` for the
+    signal) and ``signal_accessor`` (the Python name of the signal and the key
+    of its overload, from ``_signal_accessor()``). The Qt ``Signal`` will only
+    be connected to when a Traits listener is attached to this trait.
     """
 
     def __init__(self, *args, **metadata):
@@ -127,11 +350,7 @@ class QtTrait(TraitType):
         if not self.is_signal:
             # No signal to connect to.
             return
-        slot = _slot_for(weakref.ref(object), name)
-        object.__dict__[slot.__name__] = slot
-        # Get the bound signal from the QObject.
-        signal = self._get_signal(object.qobj)
-        signal.connect(slot)
+        object._signal_dispatcher().connect(object.qobj, self, name)
 
     def disconnect_signal(self, object, name):
         """ Disconnect from the Qt signal, if any.
@@ -139,44 +358,52 @@ class QtTrait(TraitType):
         if not self.is_signal:
             # No signal to disconnect from.
             return
-        slot_name = _slot_name(name)
-        slot = object.__dict__.pop(slot_name, None)
-        if slot is not None:
-            signal = self._get_signal(object.qobj)
-            # FIXME: PySide2 will raise a RuntimeError here, but it will
-            # disconnect the signal. Not sure if there are other problems.
-            try:
-                signal.disconnect(slot)
-            except RuntimeError:
-                if qt_api not in ('pyside2', 'pyside6'):
-                    raise
+        dispatcher = object.__dict__.get(SIGNAL_DISPATCHER)
+        if dispatcher is not None:
+            dispatcher.disconnect(object.qobj, self, name)
 
     def _get_signal(self, qobj):
         """ Return the correct bound signal, especially when overloaded.
         """
         # Only call this when we are a signal.
         assert self.is_signal
-        # The subclass must provide these when is_signal is True
-        assert hasattr(self, 'qname') and hasattr(self, 'meta_method')
-        arg_types = [_to_str(arg) for arg in self.meta_method.parameterTypes()]
-        signal = getattr(qobj, _python_name_for_qt_name(self.qname))
-        if len(arg_types) == 0:
+        # The subclass must provide this when is_signal is True
+        signal_name, key = self.signal_accessor
+        signal = getattr(qobj, signal_name)
+        if key is None:
             return signal
         else:
-            return signal[tuple(arg_types)]
+            return signal[key]
 
 
 class QtProperty(QtTrait):
     """ Proxy trait for a Qt static property.
 
     Pass in a ``QMetaProperty`` from the ``QMetaObject``.
+
+    Assigning a value equal to the current one does not write it to the
+    ``QObject`` nor notify listeners. Values are compared with the
+    :data:`VALUE_COMPARATORS` of their type, according to the
+    ``comparison_mode`` metadata. The automatic traits of a :class:`~.Binder`
+    compare by equality; pass ``comparison_mode`` to a ``QtProperty`` added by
+    hand to change it.
     """
     def __init__(self, meta_prop, **metadata):
         super(QtProperty, self).__init__(**metadata)
         self.meta_prop = meta_prop
+        self.comparison_mode = metadata.get('comparison_mode',
+                                            ComparisonMode.equality)
+        # The setter is pretty reliably named like this. The getter is
+        # sometimes not (e.g. isEditable() instead of editable()), so we
+        # continue to use the QMetaProperty.read() mechanism for that, which
+        # seems reliable in PySide2.
+        self.setter_name = _setter_name(
+            _python_name_for_qt_name(_to_str(meta_prop.name())))
         if meta_prop.hasNotifySignal():
             self.meta_method = self.meta_prop.notifySignal()
             self.qname = _qt_name_for_meta_method(self.meta_method)
+            self.signal_accessor = _signal_accessor(
+                self.qname, self.meta_method)
             self.is_signal = True
 
     def get(self, object, name):
@@ -191,11 +418,19 @@ class QtProperty(QtTrait):
                 msg = ("Property {0!r} not available until Binder is given "
                        "its QObject.".format(name))
                 raise AttributeError(msg)
+        batched = object.__dict__.get(BATCHED_SETATTR)
+        if batched is not None and name in batched:
+            return batched[name]
+        cache = object.__dict__.get(PROPERTY_CACHE)
+        if cache is not None and name in cache:
+            return cache[name]
         value = self.meta_prop.read(qobj)
         # PyQt4 will sometimes return a QPyNullVariant via this API even if it
         # converts it to the correct null value for the type for the property
         # attribute on the QObject itself.
         value = _guard_against_null_variant(value)
+        if self.is_signal and name in object.cached_qt_properties:
+            object._cache_qt_property(name, self, value)
         return value
 
     def set(self, object, name, value):
@@ -210,24 +445,37 @@ class QtProperty(QtTrait):
             d = object.__dict__.setdefault(DELAYED_SETATTR, {})
             d[name] = value
             return
-        old = self.meta_prop.read(qobj)
+        batched = object.__dict__.get(BATCHED_SETATTR)
+        if batched is not None:
+            batched[name] = value
+            return
+        old = _guard_against_null_variant(self.meta_prop.read(qobj))
+        if self._unchanged(old, value):
+            return
         if qt_api.startswith('pyside'):
             # PySide2 has a bug such that it will not set flags properly
             # through the QMetaProperty mechanism, like for
             # QGroupBox.alignment.  Use names instead.
-            qname = _python_name_for_qt_name(_to_str(self.meta_prop.name()))
-            # The setter is pretty reliably named like this. The getter is
-            # sometimes not (e.g. isEditable() instead of editable()), so we
-            # continue to use the QMetaProperty.read() mechanism for that,
-            # which seems reliable in PySide2.
-            setter = getattr(qobj, _setter_name(qname))
-            setter(value)
+            getattr(qobj, self.setter_name)(value)
         else:
             self.meta_prop.write(qobj, value)
+        # The notify signal normally drops the cached value, but not when the
+        # signals of the QObject are blocked.
+        object.__dict__.get(PROPERTY_CACHE, {}).pop(name, None)
         if not self.is_signal:
             # Propagate the event notification ourselves.
             object.trait_property_changed(name, old, value)
 
+    def _unchanged(self, old, value):
+        mode = self.comparison_mode
+        if mode == ComparisonMode.none:
+            return False
+        if old is value:
+            return True
+        if mode == ComparisonMode.identity or type(old) is not type(value):
+            return False
+        return _comparator_for(type(old))(old, value)
+
 
 class QtDynamicProperty(QtTrait):
     """ A Qt dynamic property added to the ``QObject``.
@@ -241,8 +489,9 @@ class QtDynamicProperty(QtTrait):
     stylesheets, by default when the property is assigned a new value, the
     ``QObject`` associated with the ``Binder`` (which should be a ``QWidget``)
     will be made to redraw itself in order to reevaluate the stylesheet rules
-    with the new value. Turn this off by passing ``styled=False`` to the
-    constructor.
+    with the new value. This is done once per iteration of the event loop for
+    each ``QObject`` by the :data:`~.restyle_scheduler`. Turn this off by
+    passing ``styled=False`` to the constructor.
     """
 
     def __init__(self, default_value=None, **metadata):
@@ -258,6 +507,9 @@ class QtDynamicProperty(QtTrait):
         if qobj is None:
             delayed_attrs = object.__dict__.get(DELAYED_SETATTR, {})
             return delayed_attrs.get(name, self.default_value)
+        batched = object.__dict__.get(BATCHED_SETATTR)
+        if batched is not None and name in batched:
+            return batched[name]
         return qobj.property(name)
 
     def set(self, object, name, value):
@@ -268,12 +520,14 @@ class QtDynamicProperty(QtTrait):
             d = object.__dict__.setdefault(DELAYED_SETATTR, {})
             d[name] = value
             return
+        batched = object.__dict__.get(BATCHED_SETATTR)
+        if batched is not None:
+            batched[name] = value
+            return
         old = qobj.property(name)
         qobj.setProperty(name, value)
         if self.metadata.get('styled', True) and hasattr(qobj, 'style'):
-            style = qobj.style()
-            style.unpolish(qobj)
-            style.polish(qobj)
+            restyle_scheduler.schedule(qobj)
         object.trait_property_changed(name, old, value)
 
 
@@ -292,6 +546,8 @@ class QtGetterSetter(QtTrait):
         if setter_name is None:
             setter_name = _setter_name(getter_name)
         self.setter_name = setter_name
+        self._python_getter_name = _python_name_for_qt_name(getter_name)
+        self._python_setter_name = _python_name_for_qt_name(setter_name)
 
     def get(self, object, name):
         """ Get the value of this trait.
@@ -305,7 +561,10 @@ class QtGetterSetter(QtTrait):
                 msg = ("Getter {0!r} not available until Binder is given "
                        "its QObject.".format(name))
                 raise AttributeError(msg)
-        return getattr(qobj, _python_name_for_qt_name(self.getter_name))()
+        batched = object.__dict__.get(BATCHED_SETATTR)
+        if batched is not None and name in batched:
+            return batched[name]
+        return getattr(qobj, self._python_getter_name)()
 
     def set(self, object, name, value):
         """ Set the value of this trait and notify listeners.
@@ -315,8 +574,12 @@ class QtGetterSetter(QtTrait):
             d = object.__dict__.setdefault(DELAYED_SETATTR, {})
             d[name] = value
             return
+        batched = object.__dict__.get(BATCHED_SETATTR)
+        if batched is not None:
+            batched[name] = value
+            return
         old = self.get(object, name)
-        getattr(qobj, _python_name_for_qt_name(self.setter_name))(value)
+        getattr(qobj, self._python_setter_name)(value)
         object.trait_property_changed(name, old, value)
 
 
@@ -339,11 +602,13 @@ class QtSlot(QtTrait):
         self.meta_method = meta_method
         self.qname = _qt_name_for_meta_method(meta_method)
         self.n_args = len(meta_method.parameterTypes())
+        self.signal_accessor = _signal_accessor(self.qname, meta_method)
+        self.python_name = self.signal_accessor[0]
 
     def get(self, object, name):
         """ Get the underlying method object.
         """
-        return getattr(object.qobj, _python_name_for_qt_name(self.qname))
+        return getattr(object.qobj, self.python_name)
 
     def set(self, object, name, value):
         """ Set the value of this trait.
@@ -355,8 +620,10 @@ class QtSlot(QtTrait):
             d = object.__dict__.setdefault(DELAYED_SETATTR, {})
             d[name] = value
             return
+        # Apply the batched assignments that came before.
+        object._flush_batched_setattr()
         args = self._process_args(value)
-        getattr(qobj, _python_name_for_qt_name(self.qname))(*args)
+        getattr(qobj, self.python_name)(*args)
 
     def _process_args(self, value):
         if self.n_args == 0:
@@ -395,6 +662,8 @@ class QtSignal(QtSlot):
             d = object.__dict__.setdefault(DELAYED_SETATTR, {})
             d[name] = value
             return
+        # Apply the batched assignments that came before.
+        object._flush_batched_setattr()
         args = self._process_args(value)
         if len(args) == 0:
             # Use the QMetaMethod to invoke the signal for PyQt4 compatibility.
@@ -450,6 +719,110 @@ class Default(object):
         return '{0.__name__}({1.value!r})'.format(type(self), self)
 
 
+class RateLimit(object):
+    """ Limit the rate of the notifications of an automatic QtTrait.
+
+    Use at the class level of a :class:`~.Binder` for traits that proxy
+    a high-frequency Qt ``Signal``, like ``valueChanged`` or ``textEdited``.
+    The last value is always delivered.
+    """
+
+    def __init__(self, throttle=None, debounce=None, latest_only=False):
+        """ Limit the rate of notifications.
+
+        Parameters
+        ----------
+        throttle : float, optional
+            Notify at most once every ``throttle`` milliseconds.
+        debounce : float, optional
+            Only notify once there has been no new value for ``debounce``
+            milliseconds. This takes precedence over ``throttle``.
+        latest_only : bool, optional
+            Only notify of the latest value once per event loop iteration.
+        """
+        self.limits = _rate_limits(throttle=throttle, debounce=debounce,
+                                   latest_only=latest_only)
+
+    def __repr__(self):
+        args = ', '.join('{0}={1!r}'.format(key, self.limits[key])
+                         for key in RATE_LIMIT_KEYS if key in self.limits)
+        return '{0.__name__}({1})'.format(type(self), args)
+
+
+def _rate_limits(**limits):
+    """ Keep the rate limits that are set.
+    """
+    for key in limits:
+        if key not in RATE_LIMIT_KEYS:
+            raise TypeError("Unknown rate limit {0!r}".format(key))
+    return {key: value for key, value in limits.items()
+            if value is not None and value is not False}
+
+
+class _BinderClassTables(object):
+    """ Per-class information needed when initializing Binders.
+    """
+    __slots__ = ('renamings', 'defaults', 'rate_limits', '_class_traits',
+                 '_metadata_rate_limits')
+
+    def __init__(self, binder_class):
+
+        #: Map Qt names to the trait names requested by Renames.
+        self.renamings = {}
+
+        #: The initial values to assign once the QObject is available:
+        #: QtDynamicProperty defaults, then Defaults and Rename defaults.
+        self.defaults = {}
+
+        #: The rate limits requested by RateLimits.
+        self.rate_limits = {}
+
+        #: The rate limits given in the metadata of the class traits, filled
+        #: in as they are asked for.
+        self._class_traits = binder_class.__class_traits__
+        self._metadata_rate_limits = {}
+
+        for name, ctrait in binder_class.class_traits(
+                is_dynamic_property=True).items():
+            self.defaults[name] = ctrait.trait_type.get_default_value()[1]
+        for name in dir(binder_class):
+            obj = getattr(binder_class, name)
+            if isinstance(obj, Default):
+                self.defaults[name] = obj.value
+            elif isinstance(obj, Rename):
+                self.renamings[obj.qt_name] = name
+                if obj.default is not Undefined:
+                    self.defaults[name] = obj.default
+            elif isinstance(obj, RateLimit):
+                self.rate_limits[name] = obj.limits
+
+    def metadata_rate_limits(self, name):
+        """ Return the rate limits in the metadata of a class trait, or None
+        if there is no such class trait.
+        """
+        limits = self._metadata_rate_limits.get(name)
+        if limits is None:
+            ctrait = self._class_traits.get(name)
+            if ctrait is None:
+                return None
+            limits = self._metadata_rate_limits[name] = _rate_limits(
+                **{key: getattr(ctrait, key) for key in RATE_LIMIT_KEYS})
+        return limits
+
+
+#: The cached _BinderClassTables of each Binder class.
+_binder_class_tables = weakref.WeakKeyDictionary()
+
+
+def _invalidate_binder_class_tables(binder_class, subclasses=True):
+    """ Forget the cached tables of a Binder class and its subclasses.
+    """
+    _binder_class_tables.pop(binder_class, None)
+    if subclasses:
+        for subclass in binder_class.trait_subclasses(True):
+            _binder_class_tables.pop(subclass, None)
+
+
 class Binder(HasStrictTraits):
     """ Traited proxy for a ``QObject`` class.
 
@@ -469,6 +842,28 @@ class Binder(HasStrictTraits):
     #: The ``QObject`` **class** that is going to be wrapped by this class.
     qclass = QtCore.QObject
 
+    #: If True, the automatic Qt traits are only indexed when the class is
+    #: initialized. Each one is created and added to the class the first time
+    #: it is accessed, assigned or listened to. Until then, it does not show up
+    #: in :meth:`class_traits`.
+    lazy_qt_traits = False
+
+    #: The names of the automatic Qt traits to create, or None to create all
+    #: of them. Qualified overloads like ``'valueChanged_int'`` need to be
+    #: listed separately. The traits of Renames and Defaults are always
+    #: created. Traits inherited from an initialized Binder ancestor are not
+    #: removed. Use ``QWIDGET_BASICS + ('text', ...)`` to keep the common
+    #: ``QWidget`` members.
+    qt_trait_names = None
+
+    #: The names of the :class:`~.QtProperty` traits whose values are cached
+    #: on each instance. Repeated reads are then dictionary lookups instead of
+    #: calls into Qt. A cached value is dropped when the notify signal of the
+    #: property is emitted or when the trait is assigned to, so only list
+    #: properties whose notify signal is emitted for every change. Properties
+    #: without a notify signal are never cached.
+    cached_qt_properties = frozenset()
+
     #: The Qt object instance that is wrapped by the :class:`~.Binder`
     #: instance.
     qobj = Instance(QtCore.QObject)
@@ -503,10 +898,79 @@ class Binder(HasStrictTraits):
         for name, ctrait in self.traits().items():
             if ctrait.is_trait_type(QtTrait):
                 ctrait.trait_type.disconnect_signal(self, name)
+        self.__dict__.pop(PROPERTY_CACHE, None)
+        dispatcher = self.__dict__.pop(SIGNAL_DISPATCHER, None)
+        if dispatcher is not None:
+            dispatcher.disconnect_all(self.qobj)
+
+    def set_rate_limit(self, name, **limits):
+        """ Limit the rate of the notifications of a trait on this instance.
+
+        The keyword arguments are those of :class:`~.RateLimit`. They replace
+        the limits declared on the class or in the trait's metadata. Without
+        any, the limits of the class apply again.
+        """
+        rate_limits = self.__dict__.setdefault(RATE_LIMITS, {})
+        if limits:
+            rate_limits[name] = _rate_limits(**limits)
+        else:
+            rate_limits.pop(name, None)
+        dispatcher = self.__dict__.get(SIGNAL_DISPATCHER)
+        trait = self.trait(name)
+        if (dispatcher is not None and trait is not None and
+                trait.is_trait_type(QtTrait) and trait.trait_type.is_signal):
+            dispatcher.update_rate_limit(trait.trait_type, name)
+
+    @contextmanager
+    def batch(self):
+        """ Batch the updates to this Binder and its descendants.
+
+        Inside the ``with`` block, painting of their ``QWidgets`` is suspended
+        and assignments to property-like traits (:class:`~.QtProperty`,
+        :class:`~.QtDynamicProperty` and :class:`~.QtGetterSetter`) are held
+        back. Reading such a trait returns the held back value. On exit, each
+        trait is written once with its last value, in the order of the first
+        assignments, so each trait notifies its listeners once. Assigning to a
+        :class:`~.QtSlot` or :class:`~.QtSignal` trait writes the held back
+        values of its Binder first.
+
+        Binders that do not have their ``QObject`` yet are not affected.
+        Batches can be nested; the values are written when the outermost one
+        exits.
+        """
+        binders = [binder for binder in self
+                   if binder.__dict__.get('qobj') is not None]
+        for binder in binders:
+            binder._begin_batch()
+        try:
+            yield self
+        finally:
+            # End every batch, even if writing the values of one fails, and
+            # raise the first error afterwards.
+            error = None
+            for binder in binders:
+                try:
+                    binder._end_batch()
+                except Exception as e:
+                    if error is None:
+                        error = e
+            if error is not None:
+                raise error
 
     def __iter__(self):
         yield self
 
+    @classmethod
+    def clear_class_cache(cls):
+        """ Forget the :class:`~.Default`, :class:`~.Rename` and
+        :class:`~.RateLimit` declarations cached for this class and its
+        subclasses.
+
+        They are read once per class. Call this after assigning or deleting
+        one on a class that has already been used.
+        """
+        _invalidate_binder_class_tables(cls)
+
     def __repr__(self):
         if self.id:
             args = 'id={0.id!r}'.format(self)
@@ -560,136 +1024,277 @@ class Binder(HasStrictTraits):
                 for func, name in connectors:
                     func(self, name)
 
-    def _collect_renamings(self, binder_class):
+    def _begin_batch(self):
+        state = self.__dict__.get(BATCH_STATE)
+        if state is not None:
+            state[0] += 1
+            return
+        qobj = self.qobj
+        restore_updates = (isinstance(qobj, QtGui.QWidget) and
+                           qobj.updatesEnabled())
+        if restore_updates:
+            qobj.setUpdatesEnabled(False)
+        self.__dict__[BATCH_STATE] = [1, restore_updates]
+        self.__dict__[BATCHED_SETATTR] = {}
+
+    def _end_batch(self):
+        state = self.__dict__[BATCH_STATE]
+        state[0] -= 1
+        if state[0] > 0:
+            return
+        del self.__dict__[BATCH_STATE]
+        try:
+            self._flush_batched_setattr(resume=False)
+        finally:
+            if state[1]:
+                self.qobj.setUpdatesEnabled(True)
+
+    def _flush_batched_setattr(self, resume=True):
+        """ Write the values assigned during a batch.
+        """
+        batched = self.__dict__.pop(BATCHED_SETATTR, None)
+        if batched is None:
+            return
+        try:
+            for name, value in batched.items():
+                setattr(self, name, value)
+        finally:
+            if resume:
+                self.__dict__[BATCHED_SETATTR] = {}
+
+    def _cache_qt_property(self, name, trait, value):
+        """ Cache the value of a QtProperty until its notify signal is
+        emitted.
+        """
+        self._signal_dispatcher().connect(self.qobj, trait, name, cached=True)
+        self.__dict__.setdefault(PROPERTY_CACHE, {})[name] = value
+
+    def _rate_limit_for(self, name):
+        """ Return the rate limits of a trait on this instance.
+        """
+        instance_limits = self.__dict__.get(RATE_LIMITS)
+        if instance_limits and name in instance_limits:
+            return instance_limits[name]
+        tables = self._binder_class_tables()
+        limits = tables.rate_limits.get(name)
+        if limits is None:
+            limits = tables.metadata_rate_limits(name)
+        if limits is None:
+            ctrait = self.trait(name)
+            limits = _rate_limits(**{key: getattr(ctrait, key)
+                                     for key in RATE_LIMIT_KEYS})
+        return limits
+
+    def _signal_dispatcher(self):
+        """ Return the dispatcher of the Qt signal connections, creating it
+        if needed.
+        """
+        dispatcher = self.__dict__.get(SIGNAL_DISPATCHER)
+        if dispatcher is None:
+            dispatcher = self.__dict__[SIGNAL_DISPATCHER] = \
+                _SignalDispatcher(self)
+        return dispatcher
+
+    @classmethod
+    def _binder_class_tables(cls):
+        """ Return the cached :class:`~._BinderClassTables` of this class.
+        """
+        tables = _binder_class_tables.get(cls)
+        if tables is None:
+            tables = _binder_class_tables[cls] = _BinderClassTables(cls)
+        return tables
+
+    @classmethod
+    def _collect_renamings(cls):
         """ Collect all of the renamings requested by Rename traits.
         """
-        renamings = {}
-        # Find all requested renamings.
-        for name in dir(binder_class):
-            obj = getattr(binder_class, name)
-            if isinstance(obj, Rename):
-                renamings[obj.qt_name] = name
-        return renamings
+        return cls._binder_class_tables().renamings
 
-    def _add_qt_properties(self, binder_class, renamings, seen):
+    @classmethod
+    def _add_class_trait(cls, name, trait, is_subclass):
+        """ Add a trait to this class only, forgetting the cached tables.
+        """
+        super(Binder, cls)._add_class_trait(name, trait, is_subclass)
+        if trait.is_dynamic_property:
+            _invalidate_binder_class_tables(cls, subclasses=False)
+
+    @classmethod
+    def _add_qt_properties(cls, info, renamings, seen, table):
         """ Add QtProperties.
         """
-        meta_object = binder_class.qclass.staticMetaObject
-        for i in range(meta_object.propertyCount()):
-            meta_prop = meta_object.property(i)
-            qname = _python_name_for_qt_name(meta_prop.name())
+        for index, qname in info.properties:
             name = renamings.get(qname, qname)
             if name not in seen:
                 if name.endswith('_'):
                     # See #21
                     continue
-                binder_class.add_class_trait(name, QtProperty(meta_prop))
+                table[name] = ('property', index)
                 seen.add(name)
 
-    def _add_qt_signals_slots(self, binder_class, renamings, seen):
+    @classmethod
+    def _add_qt_signals_slots(cls, info, renamings, seen, table):
         """ Add QtSignals and QtSlots.
         """
-        meta_object = binder_class.qclass.staticMetaObject
         overloads = defaultdict(list)
-        for i in range(meta_object.methodCount()):
-            meta_meth = meta_object.method(i)
-            qname = _python_name_for_qt_name(
-                _qt_name_for_meta_method(meta_meth))
+        for index, qname, method_type, arg_types in info.methods:
             name = renamings.get(qname, qname)
-            overloads[name].append(meta_meth)
+            overloads[name].append((index, method_type, arg_types))
 
         for name, methods in overloads.items():
-            method_type = methods[0].methodType()
-            if method_type == QtCore.QMetaMethod.Slot:
-                trait_type = QtSlot
-            elif method_type == QtCore.QMetaMethod.Signal:
-                trait_type = QtSignal
-            else:
-                continue
+            # All overloads share the method type of the first one.
+            method_type = methods[0][1]
             # In the case of overloads, always register the first one
             # unqualified. This is largely to support across the gap between
             # Qt4 and Qt6 where some slots lost their overloads.
             # C.f. QComboBox.currentIndexChanged()
-            meta_meth = methods[0]
             if name not in seen:
                 if name.endswith('_'):
                     # See #21
                     continue
-                trait = trait_type(meta_meth)
-                binder_class.add_class_trait(name, trait)
+                table[name] = (method_type, methods[0][0])
                 seen.add(name)
             # If there are overloads, qualify the name with the types to
             # provide disambiguation.
             if len(methods) > 1:
-                for meta_meth in methods:
+                for index, _, arg_types in methods:
                     # Add the argument types to the name to disambiguate
-                    arg_types = [_to_str(t).rstrip('*')
-                                 for t in meta_meth.parameterTypes()]
-                    qualname = '_'.join([name] + arg_types)
+                    qualname = '_'.join(
+                        [name] + [t.rstrip('*') for t in arg_types])
                     if qualname not in seen:
                         if qualname.endswith('_'):
                             # See #21
                             continue
-                        trait = trait_type(meta_meth)
-                        binder_class.add_class_trait(qualname, trait)
+                        table[qualname] = (method_type, index)
                         seen.add(qualname)
 
-    def _add_implied_properties(self, binder_class, renamings, seen):
+    @classmethod
+    def _add_implied_properties(cls, info, renamings, seen, table):
         """ Add properties defined by pairs of getters and setters.
         """
-        # Add all getter/setter pairs that we can identify.
-        methods = set()
-        # Use getmembers() to collect inherited methods from ancestor classes,
-        # too.
-        for cls in binder_class.qclass.mro():
-            if not issubclass(cls, QtCore.QObject):
-                break
-            for name in dir(cls):
-                if name.startswith('__'):
-                    continue
-                class_attr = getattr(binder_class.qclass, name)
-                # sip methoddescriptor objects do not have __call__() defined.
-                if (callable(class_attr) or
-                        type(class_attr).__name__ == 'methoddescriptor'):
-                    methods.add(name)
-        for qname in methods:
-            # FIXME: We do not know if these are true getter/setters, where
-            # the getter has 0 arguments and the setter has just the 1. For
-            # example, `QObject.property(name)` and
-            # `QObject.setProperty(name, value)` get misidentified here.
-            # Unfortunately, the method objects do not have any information
-            # about their argument structure.
-            if qname == 'property':
+        for qname, setter in info.getter_setters:
+            name = renamings.get(qname, qname)
+            if name.endswith('_'):
+                # See #21
                 continue
-            putative_setter = _setter_name(qname)
-            if putative_setter in methods:
-                name = renamings.get(qname, qname)
-                if name.endswith('_'):
-                    # See #21
-                    continue
-                if name in seen:
-                    # We've done this pair earlier, probably through the
-                    # QMetaProperty mechanism, so we can ignore it here.
-                    continue
-                binder_class.add_class_trait(
-                    name, QtGetterSetter(qname, putative_setter))
+            if name in seen:
+                # We've done this pair earlier, probably through the
+                # QMetaProperty mechanism, so we can ignore it here.
+                continue
+            table[name] = ('getter_setter', (qname, setter))
 
-    def _initialize_binder_class(self):
+    @classmethod
+    def _build_qt_trait_table(cls, renamings, seen):
+        """ Map the names of the automatic traits to their specs.
+
+        Names in ``seen`` are skipped. The set is updated as names are added.
+        """
+        info = get_class_info(cls.qclass)
+        table = {}
+        cls._add_qt_properties(info, renamings, seen, table)
+        cls._add_qt_signals_slots(info, renamings, seen, table)
+        cls._add_implied_properties(info, renamings, seen, table)
+        return table
+
+    @classmethod
+    def _create_qt_trait(cls, spec):
+        """ Create the automatic QtTrait described by a table entry.
+        """
+        kind, key = spec
+        if kind == 'getter_setter':
+            return QtGetterSetter(*key)
+        meta_object = cls.qclass.staticMetaObject
+        if kind == 'property':
+            return QtProperty(meta_object.property(key))
+        elif kind == 'slot':
+            return QtSlot(meta_object.method(key))
+        else:
+            return QtSignal(meta_object.method(key))
+
+    @classmethod
+    def _lazy_qt_traits_name(cls):
+        return '_{0.__name__}__lazy_qt_traits'.format(cls)
+
+    @classmethod
+    def _qt_ctraits_name(cls):
+        return '_{0.__name__}__qt_ctraits'.format(cls)
+
+    @classmethod
+    def _inherited_qt_ctraits(cls):
+        """ Find the automatic traits of the nearest initialized Binder
+        ancestor that wraps the same Qt class or one of its bases.
+
+        Returns a dict mapping table entries to ``CTraits``, or an empty dict
+        if there is no such ancestor.
+        """
+        for base in cls.__mro__[1:]:
+            if not (isinstance(base, type) and issubclass(base, Binder)):
+                continue
+            ctraits = base.__dict__.get(base._qt_ctraits_name())
+            if ctraits is not None and issubclass(cls.qclass, base.qclass):
+                return ctraits
+        return {}
+
+    @classmethod
+    def _initialize_binder_class(cls):
         """ Ensure that the binder class has been initialized.
+
+        The trait table is loaded from a module generated by
+        :mod:`~.static_traits` if one matches, or else built from
+        :func:`~.get_class_info`, which may use the on-disk cache. The traits
+        of the nearest initialized ancestor are shared rather than recreated,
+        so only the Qt members that the ancestor does not wrap and any
+        different renamings get new traits. Only the traits named in
+        :attr:`qt_trait_names` are kept. If :attr:`lazy_qt_traits` is set,
+        the traits are only indexed here and created later in
+        :meth:`__prefix_trait__`.
         """
-        binder_class = self.__class__
         initialized_name = '_{0.__name__}__binder_class_initialized'.format(
-            binder_class)
+            cls)
         # Look directly at the __dict__. Even with the name disambiguation, we
         # still only want to look directly at this class, not its superclasses.
-        initialized = binder_class.__dict__.get(initialized_name, False)
+        initialized = cls.__dict__.get(initialized_name, False)
         if not initialized:
-            renamings = self._collect_renamings(binder_class)
-            seen = set(binder_class.class_trait_names())
-            self._add_qt_properties(binder_class, renamings, seen)
-            self._add_qt_signals_slots(binder_class, renamings, seen)
-            self._add_implied_properties(binder_class, renamings, seen)
-            setattr(binder_class, initialized_name, True)
+            renamings = cls._collect_renamings()
+            seen = set(cls.class_trait_names())
+            table = load_static_qt_traits(cls, renamings)
+            if table is None:
+                table = cls._build_qt_trait_table(renamings, seen)
+            else:
+                table = {name: spec for name, spec in table.items()
+                         if name not in seen}
+            if cls.qt_trait_names is not None:
+                allowed = set(cls.qt_trait_names)
+                allowed.update(renamings.values())
+                allowed.update(cls._binder_class_tables().defaults)
+                table = {name: spec for name, spec in table.items()
+                         if name in allowed}
+            if cls.lazy_qt_traits:
+                setattr(cls, cls._lazy_qt_traits_name(), table)
+            else:
+                # The ancestor's traits were already added to this class when
+                # it was initialized, unless they have been overridden or
+                # renamed here.
+                ctraits = dict(cls._inherited_qt_ctraits())
+                for name, spec in table.items():
+                    ctrait = ctraits.get(spec)
+                    if ctrait is None:
+                        ctrait = cls._create_qt_trait(spec).as_ctrait()
+                        ctraits[spec] = ctrait
+                    cls.add_class_trait(name, ctrait)
+                setattr(cls, cls._qt_ctraits_name(), ctraits)
+            setattr(cls, initialized_name, True)
+
+    def __prefix_trait__(self, name, is_set):
+        """ Create a lazy automatic QtTrait when it is first needed.
+        """
+        cls = type(self)
+        table = cls.__dict__.get(cls._lazy_qt_traits_name())
+        if table is not None:
+            spec = table.pop(name, None)
+            if spec is not None:
+                cls.add_class_trait(name, cls._create_qt_trait(spec))
+                return cls.__class_traits__[name]
+        return super(Binder, self).__prefix_trait__(name, is_set)
 
     def _qobj_changed(self, old, new):
         """ Hook up any delayed connections to the new ``qobj``.
@@ -704,19 +1309,15 @@ class Binder(HasStrictTraits):
             while delayed_connections:
                 func, name = delayed_connections.popleft()
                 func(self, name)
-        # Create and initialized any Qt dynamic properties that have been
-        # requested.
+        # Create and initialize any Qt dynamic properties that have been
+        # requested, along with any explicit Defaults.
         values = {}
-        for name, ctrait in self.traits(is_dynamic_property=True).items():
-            values[name] = ctrait.trait_type.get_default_value()[1]
-        # And any explicit Defaults.
-        cls = type(self)
-        for name in dir(cls):
-            obj = getattr(cls, name)
-            if isinstance(obj, Default):
-                values[name] = obj.value
-            if isinstance(obj, Rename) and obj.default is not Undefined:
-                values[name] = obj.default
+        class_traits = self.__class_traits__
+        for name, ctrait in self._instance_traits().items():
+            # Dynamic properties added to just this instance.
+            if ctrait.is_dynamic_property and name not in class_traits:
+                values[name] = ctrait.trait_type.get_default_value()[1]
+        values.update(self._binder_class_tables().defaults)
         # And any delayed setattrs.
         values.update(self.__dict__.pop(DELAYED_SETATTR, {}))
         self.trait_set(**values)
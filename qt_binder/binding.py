@@ -9,60 +9,205 @@
 # Thanks for using Enthought open source!
 
 from abc import ABCMeta, abstractmethod
-from collections import deque
-import parser
+import ast
+from concurrent.futures import ThreadPoolExecutor
+import functools
+import logging
 import re
-import symbol
-import token
+import threading
 
 import six
 
 from traits.trait_base import xgetattr, xsetattr
 
-from .binder import Binder
+from .binder import RATE_LIMIT_KEYS, Binder, QtProperty, _NOTHING, \
+    _disconnect, _equal
+from .constants import BATCH_STATE, RATE_LIMITS
+from .introspection import _to_str
+from .qt import QtCore
 
 
-class AnyString(object):
-    """ Compare equal to any string type.
+logger = logging.getLogger(__name__)
+
+#: The options that can be given in brackets after the binder trait.
+BINDING_OPTIONS = RATE_LIMIT_KEYS + ('threaded', 'coalesce')
+
+_FLAG_OPTIONS = ('latest_only', 'threaded', 'coalesce')
+
+#: The executor running the model updates of threaded bindings.
+_executor = None
+
+#: The _GuiInvoker marshaling updates back to the GUI thread.
+_gui_invoker = None
+
+
+def get_binding_executor():
+    """ Return the executor that runs the model updates of threaded
+    bindings, creating a thread pool if needed.
     """
-    def __eq__(self, other):
-        return isinstance(other, six.string_types)
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=4,
+                                       thread_name_prefix='qt_binder')
+    return _executor
+
+
+def set_binding_executor(executor):
+    """ Set the ``concurrent.futures.Executor`` that runs the model updates
+    of threaded bindings.
+    """
+    global _executor
+    _executor = executor
 
-    def __ne__(self, other):
-        return not (self == other)
 
+def _source_between(lines, start, end):
+    """ Return the source between two (lineno, col_offset) positions.
 
-def yield_subtrees(expr):
-    """ Preorder traversal of all subtrees in an expression.
+    The lines are UTF-8 encoded, like the offsets of the ``ast`` nodes.
     """
-    root = parser.expr(expr).totuple()
-    stack = deque([root])
-    while stack:
-        node = stack.popleft()
-        children = [child for child in node[1:] if isinstance(child, tuple)]
-        stack.extend(children)
-        yield node
+    (start_line, start_col), (end_line, end_col) = start, end
+    if start_line == end_line:
+        return lines[start_line - 1][start_col:end_col]
+    parts = [lines[start_line - 1][start_col:]]
+    parts.extend(lines[start_line:end_line - 1])
+    parts.append(lines[end_line - 1][:end_col])
+    return b'\n'.join(parts)
+
+
+def _dotted_name(node, lines):
+    """ Return the dotted name of a chain of attributes on a name, or None.
+
+    Parentheses break the chain, as in ``(object.foo).text``.
+    """
+    parts = []
+    while isinstance(node, ast.Attribute):
+        value = node.value
+        gap = _source_between(
+            lines,
+            (value.end_lineno, value.end_col_offset),
+            (node.end_lineno,
+             node.end_col_offset - len(node.attr.encode('utf-8'))))
+        if gap.strip() != b'.':
+            return None
+        parts.append(node.attr)
+        node = value
+    if not isinstance(node, ast.Name):
+        return None
+    parts.append(node.id)
+    return '.'.join(reversed(parts))
 
 
 def find_ext_attrs(expr):
     """ Find all dotted references in the expression.
     """
+    tree = ast.parse(expr, mode='eval')
+    lines = expr.encode('utf-8').split(b'\n')
     ext_attrs = []
-    for subtree in yield_subtrees(expr):
-        if subtree[1] == (symbol.atom, (token.NAME, AnyString())):
-            parts = [subtree[1][1][1]]
-            for trailer in subtree[2:]:
-                if trailer == (symbol.trailer,
-                               (token.DOT, '.'),
-                               (token.NAME, AnyString())):
-                    parts.append(trailer[2][1])
-                else:
-                    break
-            if len(parts) > 1:
-                ext_attrs.append('.'.join(parts))
+    stack = [tree.body]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Attribute):
+            dotted = _dotted_name(node, lines)
+            if dotted is not None:
+                ext_attrs.append(dotted)
+                continue
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
     return ext_attrs
 
 
+@functools.lru_cache(maxsize=1024)
+def compile_expression(expr):
+    """ Compile an expression once, caching the code object by its text.
+    """
+    return compile(expr, '<binding>', 'eval')
+
+
+_options_regex = re.compile(r'^\s*(.*?)\s*\[(.*)\]\s*$')
+
+
+def split_binding_options(binder_trait):
+    """ Split the options off a binder trait.
+
+    ``'value[debounce=200]'`` gives ``('value', {'debounce': 200.0})``.
+    A bare option name, like ``threaded``, is set to True.
+    """
+    match = _options_regex.match(binder_trait)
+    if match is None:
+        return binder_trait, {}
+    binder_trait, text = match.groups()
+    options = {}
+    for option in text.split(','):
+        if '=' in option:
+            key, value = [x.strip() for x in option.split('=', 1)]
+            if key in _FLAG_OPTIONS:
+                value = value not in ('0', 'False', 'false')
+            else:
+                value = float(value)
+        else:
+            key, value = option.strip(), True
+        if key not in BINDING_OPTIONS:
+            raise ValueError("Unknown binding option {0!r} in {1!r}".format(
+                key, binder_trait))
+        options[key] = value
+    return binder_trait, options
+
+
+class _GuiInvoker(QtCore.QObject):
+    """ Run functions on the thread that created the invoker.
+    """
+
+    _invoke = QtCore.Signal(object)
+
+    def __init__(self):
+        super(_GuiInvoker, self).__init__()
+        # Emitting from another thread queues the call.
+        self._invoke.connect(self._run)
+
+    def is_current(self):
+        return QtCore.QThread.currentThread() == self.thread()
+
+    def invoke(self, func):
+        self._invoke.emit(func)
+
+    def _run(self, func):
+        func()
+
+
+def _get_gui_invoker():
+    # Only call this from the GUI thread, e.g. from bind().
+    global _gui_invoker
+    if _gui_invoker is None:
+        _gui_invoker = _GuiInvoker()
+    return _gui_invoker
+
+
+class _EchoGuard(object):
+    """ Drop the values a two-way binding would send back to where they came
+    from.
+
+    Each direction of the binding is a source. The guard remembers the last
+    value transferred from a source, and a value arriving from the other
+    source that equals it is an echo.
+    """
+    def __init__(self):
+        # {source: the last value transferred from it}; only the last
+        # transfer is kept, so a change on the other side clears it.
+        self._last = {}
+
+        #: The number of echoes that were dropped.
+        self.n_suppressed = 0
+
+    def accept(self, source, value):
+        """ Record a transfer from the source, or return False for an echo.
+        """
+        for other, last in self._last.items():
+            if other != source and _equal(last, value):
+                self.n_suppressed += 1
+                return False
+        self._last = {source: value}
+        return True
+
+
 class _TraitModified(object):
     """ Expose a well-formed trait change handler function with extra data.
 
@@ -75,8 +220,17 @@ class _TraitModified(object):
         self.xattr = xattr
         self._in_handler = False
 
+        #: The _EchoGuard shared with the other direction of a SyncedWith,
+        #: and the source this handler transfers from.
+        self.echo_guard = None
+        self.source = None
+
+    def _accept(self, new):
+        guard = self.echo_guard
+        return guard is None or guard.accept(self.source, new)
+
     def handler(self, new):
-        if not self._in_handler:
+        if not self._in_handler and self._accept(new):
             self._in_handler = True
             try:
                 xsetattr(self.obj, self.xattr, new)
@@ -84,29 +238,258 @@ class _TraitModified(object):
                 self._in_handler = False
 
 
+class _ThreadedTraitModified(_TraitModified):
+    """ Assign the new values on a worker thread.
+
+    One value is assigned at a time. A value that is superseded by a newer one
+    before its assignment starts is dropped.
+    """
+    def __init__(self, obj, xattr):
+        super(_ThreadedTraitModified, self).__init__(obj, xattr)
+        self._lock = threading.Lock()
+        self._pending = _NOTHING
+        self._running = False
+        self._bound = True
+
+        #: Incremented for each new value.
+        self.generation = 0
+
+        #: The generation of the value being assigned by the worker, if any.
+        self.active_generation = None
+
+        #: The number of values that were dropped.
+        self.n_dropped = 0
+
+    def handler(self, new):
+        if self._in_handler or not self._accept(new):
+            return
+        with self._lock:
+            self.generation += 1
+            if self._pending is not _NOTHING:
+                self.n_dropped += 1
+            self._pending = (self.generation, new)
+            if self._running:
+                return
+            self._running = True
+        try:
+            get_binding_executor().submit(self._run)
+        except Exception:
+            # E.g. the executor was shut down. Drop the value so that the next
+            # one tries again.
+            with self._lock:
+                self._running = False
+                self._pending = _NOTHING
+            raise
+
+    def is_stale(self, generation):
+        """ Whether a newer value arrived after the given generation.
+        """
+        return generation != self.generation
+
+    def cancel(self):
+        """ Drop the pending value and stop assigning.
+        """
+        with self._lock:
+            self._bound = False
+            self._pending = _NOTHING
+
+    def _run(self):
+        while True:
+            with self._lock:
+                item = self._pending
+                self._pending = _NOTHING
+                if item is _NOTHING or not self._bound:
+                    self._running = False
+                    return
+            self.active_generation, value = item
+            try:
+                xsetattr(self.obj, self.xattr, value)
+            except Exception:
+                logger.exception('Error assigning %r to %r', value,
+                                 self.xattr)
+            finally:
+                self.active_generation = None
+
+
+class _Marshaled(object):
+    """ Call a change handler on the GUI thread.
+
+    If the change comes from the worker thread of the threaded push of the
+    same binding, and the pushed value has been superseded since, it is
+    dropped.
+    """
+    def __init__(self, handler, binding):
+        self.wrapped = handler
+        self.binding = binding
+        self.invoker = _get_gui_invoker()
+        self._bound = True
+
+        #: The number of stale changes that were dropped.
+        self.n_dropped = 0
+
+    def handler(self, new):
+        self._call(new)
+
+    def handler_no_args(self):
+        self._call()
+
+    def cancel(self):
+        self._bound = False
+
+    def _call(self, *args):
+        invoker = self.invoker
+        if invoker.is_current():
+            self.wrapped(*args)
+            return
+        pusher = getattr(self.binding, 'pusher', None)
+        generation = None
+        if pusher is not None:
+            generation = pusher.active_generation
+        invoker.invoke(lambda: self._call_later(pusher, generation, args))
+
+    def _call_later(self, pusher, generation, args):
+        if not self._bound:
+            return
+        if generation is None:
+            self.wrapped(*args)
+        elif pusher.is_stale(generation):
+            self.n_dropped += 1
+        else:
+            # Do not push the change back, like the synchronous handlers.
+            pusher._in_handler = True
+            try:
+                self.wrapped(*args)
+            finally:
+                pusher._in_handler = False
+
+
+def _notifying_property(binder, name):
+    if not isinstance(binder, Binder) or binder.qobj is None or '.' in name:
+        return None
+    ctrait = binder.trait(name)
+    if ctrait is None:
+        return None
+    prop = ctrait.trait_type
+    if not isinstance(prop, QtProperty) or not prop.is_signal:
+        return None
+    return prop
+
+
+class _NativeConnection(object):
+    """ Connect the notify signal of a Qt property of one Binder straight to
+    the setter slot of a Qt property of another, so that the changes are
+    propagated by Qt without going through Python.
+    """
+    def __init__(self, signal, slot):
+        self.signal = signal
+        self.slot = slot
+        signal.connect(slot)
+
+    @classmethod
+    def between(cls, source, source_name, target, target_name):
+        """ Connect the properties if both sides allow it.
+
+        Both traits must be :class:`~.QtProperty` traits with a notify signal,
+        so that listeners of either trait are still notified. The signal must
+        send exactly the type of the target property, whose setter must be a
+        slot. Rate-limited source traits and targets in a
+        :meth:`~.Binder.batch` are left to Python. Returns ``None`` when the
+        properties cannot be connected.
+        """
+        source_prop = _notifying_property(source, source_name)
+        target_prop = _notifying_property(target, target_name)
+        if source_prop is None or target_prop is None:
+            return None
+        if not target_prop.meta_prop.isWritable():
+            return None
+        if source._rate_limit_for(source_name):
+            return None
+        if BATCH_STATE in target.__dict__:
+            return None
+        type_name = _to_str(target_prop.meta_prop.typeName())
+        parameter_types = [
+            _to_str(t) for t in source_prop.meta_method.parameterTypes()]
+        if parameter_types != [type_name]:
+            return None
+        signature = '{0}({1})'.format(target_prop.setter_name, type_name)
+        if target.qobj.metaObject().indexOfSlot(signature) == -1:
+            return None
+        return cls(source_prop._get_signal(source.qobj),
+                   getattr(target.qobj, target_prop.setter_name))
+
+    def disconnect(self):
+        _disconnect(self.signal, self.slot)
+
+
 class _EvaluateExpression(_TraitModified):
 
     def __init__(self, obj, xattr, context, expression):
         super(_EvaluateExpression, self).__init__(obj, xattr)
         self.context = context
         self.expression = expression
+        self.code = compile_expression(expression)
 
     def handler(self):
+        self.evaluate()
+
+    def evaluate(self):
         if not self._in_handler:
             self._in_handler = True
             try:
-                value = eval(self.expression, self.context)
+                value = eval(self.code, self.context)
                 xsetattr(self.obj, self.xattr, value)
             finally:
                 self._in_handler = False
 
 
+class _CoalescedEvaluateExpression(_EvaluateExpression):
+    """ Evaluate the expression once per event loop iteration, however many
+    of its dependencies changed.
+    """
+
+    def __init__(self, obj, xattr, context, expression):
+        super(_CoalescedEvaluateExpression, self).__init__(
+            obj, xattr, context, expression)
+        self._scheduled = False
+        self._bound = True
+
+        #: The number of changes of the dependencies.
+        self.n_requested = 0
+
+        #: The number of evaluations made for those changes.
+        self.n_evaluated = 0
+
+    @property
+    def n_saved(self):
+        """ The number of evaluations that were avoided by coalescing.
+        """
+        return self.n_requested - self.n_evaluated - int(self._scheduled)
+
+    def handler(self):
+        self.n_requested += 1
+        if not self._scheduled:
+            self._scheduled = True
+            QtCore.QTimer.singleShot(0, self._evaluate_later)
+
+    def cancel(self):
+        self._bound = False
+
+    def _evaluate_later(self):
+        self._scheduled = False
+        if self._bound:
+            self.n_evaluated += 1
+            self.evaluate()
+
+
 class Binding(six.with_metaclass(ABCMeta, object)):
     """ Interface for a single binding pair.
     """
 
     _op_regex = re.compile(r'\s*(=|>>|<<|:=)\s*')
 
+    # A binder trait with options, which may contain '='.
+    _with_options_regex = re.compile(r'\s*[\w.]+\s*\[[^\]]*\]')
+
     def __init__(self, left, right):
         self.left = left
         self.right = right
@@ -131,7 +514,12 @@ class Binding(six.with_metaclass(ABCMeta, object)):
         subclass.
         """
         if isinstance(obj, six.string_types):
-            left, op, right = cls._op_regex.split(obj, 1)
+            match = cls._with_options_regex.match(obj)
+            if match is not None:
+                _, op, right = cls._op_regex.split(obj[match.end():], 1)
+                left = match.group().strip()
+            else:
+                left, op, right = cls._op_regex.split(obj, 1)
             return {
                 '=': SetOnceTo,
                 ':=': SyncedWith,
@@ -158,7 +546,10 @@ class Binding(six.with_metaclass(ABCMeta, object)):
 
     def _normalize_binder_trait(self, binder, binder_trait, context):
         """ Normalize the Binder and binder trait.
+
+        Any options are dropped from the binder trait.
         """
+        binder_trait = split_binding_options(binder_trait)[0]
         if '.' in binder_trait:
             head, tail = binder_trait.split('.', 1)
             if isinstance(context.get(head, None), Binder):
@@ -196,7 +587,7 @@ class SetOnceTo(Binding):
         expression = self.right
         the_binder, binder_trait = self._normalize_binder_trait(
             binder, self.left, context)
-        value = eval(expression, context)
+        value = eval(compile_expression(expression), context)
         xsetattr(the_binder, binder_trait, value)
 
     def unbind(self):
@@ -217,21 +608,58 @@ class PulledFrom(Binding):
     not true: see :class:`~.PushedTo` and :class:`~.SyncedWith` for that
     functionality.
 
+    With the ``threaded`` option, e.g. ``'value[threaded] << object.foo'``,
+    changes made to the model on other threads are assigned to the ``Binder``
+    on the GUI thread.
+
+    With the ``coalesce`` option, e.g.
+    ``'text[coalesce] << "%s %s" % (object.a, object.b)'``, an expression is
+    evaluated once on the next iteration of the event loop, however many of
+    its dependencies changed in the meantime. The :attr:`evaluator` counts
+    the evaluations in ``n_requested``, ``n_evaluated`` and ``n_saved``. A
+    single attribute is assigned as soon as it changes, so ``coalesce`` is a
+    ``ValueError`` there.
+
     Mnemonic: ``binder_trait is pulled from context_trait``
     """
+
+    #: Whether Qt properties may be connected natively by :meth:`bind`.
+    native_connections = True
+
     # FIXME: Allow users to explicitly specify a `depends_on` list. This would
     # let users avoid problems with too many dots.
     def bind(self, binder, context):
+        options = split_binding_options(self.left)[1]
+        threaded = options.get('threaded', False)
         the_binder, binder_trait = self._normalize_binder_trait(
             binder, self.left, context)
         rhs = self.right.strip()
         ext_traits = find_ext_attrs(rhs)
+        self.marshaled = None
+        self.evaluator = None
+        self.puller = None
+        self.pull_connection = None
         if ext_traits == [rhs]:
             # Simple case of one attribute.
+            if options.get('coalesce', False):
+                msg = "The coalesce option only applies to expressions: {0!r}"
+                raise ValueError(msg.format(str(self)))
             context_name, xattr = rhs.split('.', 1)
             context_obj = context[context_name]
 
-            handler = _TraitModified(the_binder, binder_trait).handler
+            if self.native_connections and not threaded:
+                self.pull_connection = _NativeConnection.between(
+                    context_obj, xattr, the_binder, binder_trait)
+            if self.pull_connection is not None:
+                self.pull_handler_data = []
+                xsetattr(the_binder, binder_trait,
+                         xgetattr(context_obj, xattr))
+                return
+            self.puller = _TraitModified(the_binder, binder_trait)
+            handler = self.puller.handler
+            if threaded:
+                self.marshaled = _Marshaled(handler, self)
+                handler = self.marshaled.handler
             # FIXME: Only check as far down as are HasTraits objects available.
             # We would like to be able to include references to methods on
             # attributes of HasTraits classes.
@@ -252,8 +680,16 @@ class PulledFrom(Binding):
         else:
             # Expression.
             self.pull_handler_data = []
-            handler = _EvaluateExpression(the_binder, binder_trait,
-                                          context, rhs).handler
+            if options.get('coalesce', False):
+                evaluator_class = _CoalescedEvaluateExpression
+            else:
+                evaluator_class = _EvaluateExpression
+            self.evaluator = evaluator_class(the_binder, binder_trait,
+                                             context, rhs)
+            handler = self.evaluator.handler
+            if threaded:
+                self.marshaled = _Marshaled(handler, self)
+                handler = self.marshaled.handler_no_args
             for ext_trait in ext_traits:
                 context_name, xattr = ext_trait.split('.', 1)
                 if context_name not in context:
@@ -262,12 +698,18 @@ class PulledFrom(Binding):
                 context_obj = context[context_name]
                 context_obj.on_trait_change(handler, xattr)
                 self.pull_handler_data.append((context_obj, handler, xattr))
-            # Call the handler once to evaluate and set the value initially.
-            handler()
+            # Evaluate once to set the value initially.
+            self.evaluator.evaluate()
 
     def unbind(self):
         for context_obj, handler, xattr in self.pull_handler_data:
             context_obj.on_trait_change(handler, xattr, remove=True)
+        if self.pull_connection is not None:
+            self.pull_connection.disconnect()
+        if self.marshaled is not None:
+            self.marshaled.cancel()
+        if isinstance(self.evaluator, _CoalescedEvaluateExpression):
+            self.evaluator.cancel()
 
     def __str__(self):
         return '{0.left} << {0.right}'.format(self)
@@ -284,22 +726,77 @@ class PushedTo(Binding):
     true: see :class:`~.PulledFrom` and :class:`~.SyncedWith` for that
     functionality.
 
+    To limit the rate at which a high-frequency Qt signal is sent, give the
+    options of :class:`~.RateLimit` in brackets after the binder trait, e.g.
+    ``'value[debounce=200] >> object.foo'`` or
+    ``'value[latest_only] >> object.foo'``. They apply to the trait of the
+    ``Binder`` instance while it is bound.
+
+    With the ``threaded`` option, e.g. ``'value[threaded] >> object.foo'``,
+    the model is assigned on a worker thread of the
+    :func:`~.get_binding_executor` so that a slow model does not block the
+    GUI. The values are assigned one at a time, and a value that is
+    superseded by a newer one before its assignment starts is dropped.
+
+    When both sides are Qt properties of Binders with notify signals, e.g.
+    ``'slider.value >> spin.value'`` with two Binders of a ``Bound``, and the
+    signal sends the type of the target property to a setter slot, the signal
+    is connected straight to the slot so that Qt propagates the changes
+    without going through Python. The same goes for :class:`~.PulledFrom`.
+    Such a connection is only made when the source trait has no rate limit
+    and the target ``Binder`` is not in a :meth:`~.Binder.batch`; rate limits
+    set and batches started after binding do not apply to it.
+    :class:`~.SyncedWith` never uses it, so that its echoes are suppressed.
+
     Mnemonic: ``binder_trait is sent to context_trait``
     """
+
+    #: Whether Qt properties may be connected natively by :meth:`bind`.
+    native_connections = True
+
     def bind(self, binder, context):
         ext_trait = self.right
+        options = split_binding_options(self.left)[1]
+        limits = {key: value for key, value in options.items()
+                  if key in RATE_LIMIT_KEYS}
         the_binder, binder_trait = self._normalize_binder_trait(
             binder, self.left, context)
         context_name, xattr = ext_trait.split('.', 1)
         context_obj = context[context_name]
 
-        handler = _TraitModified(context_obj, xattr).handler
-        the_binder.on_trait_change(handler, binder_trait)
-        self.pushed_handler_data = (the_binder, handler, binder_trait)
+        # The limits set on the instance before, restored by unbind().
+        self.previous_limits = the_binder.__dict__.get(
+            RATE_LIMITS, {}).get(binder_trait)
+        if limits:
+            the_binder.set_rate_limit(binder_trait, **limits)
+        threaded = options.get('threaded', False)
+        self.pusher = None
+        self.push_connection = None
+        if self.native_connections and not threaded:
+            self.push_connection = _NativeConnection.between(
+                the_binder, binder_trait, context_obj, xattr)
+        if self.push_connection is not None:
+            handler = None
+        else:
+            if threaded:
+                self.pusher = _ThreadedTraitModified(context_obj, xattr)
+            else:
+                self.pusher = _TraitModified(context_obj, xattr)
+            handler = self.pusher.handler
+            the_binder.on_trait_change(handler, binder_trait)
+        self.pushed_handler_data = (the_binder, handler, binder_trait, limits)
 
     def unbind(self):
-        the_binder, handler, binder_trait = self.pushed_handler_data
-        the_binder.on_trait_change(handler, binder_trait, remove=True)
+        the_binder, handler, binder_trait, limits = self.pushed_handler_data
+        if self.push_connection is not None:
+            self.push_connection.disconnect()
+        else:
+            the_binder.on_trait_change(handler, binder_trait, remove=True)
+        if limits:
+            the_binder.set_rate_limit(binder_trait,
+                                      **(self.previous_limits or {}))
+        if isinstance(self.pusher, _ThreadedTraitModified):
+            self.pusher.cancel()
 
     def __str__(self):
         return '{0.left} >> {0.right}'.format(self)
@@ -316,11 +813,35 @@ class SyncedWith(PulledFrom, PushedTo):
     :class:`~.PulledFrom` and :class:`~.PushedTo` for unidirectional
     synchronization.
 
+    With the ``threaded`` option, the model is assigned on a worker thread as
+    with :class:`~.PushedTo`, and its changes are assigned back to the
+    ``Binder`` on the GUI thread. Changes made by the worker for a value that
+    has been superseded in the meantime are not assigned back.
+
+    A value is not sent back to the side it came from: when it equals the last
+    value transferred the other way, it is an echo and is dropped. The
+    :attr:`echo_guard` counts them in ``n_suppressed``.
+
+    Unlike :class:`~.PushedTo` and :class:`~.PulledFrom`, the Qt properties of
+    two Binders are never connected natively, even when their types match:
+    both directions go through Python so that the echo guard sees each value.
+
     Mnemonic: ``binder_trait is synced with context_trait``
     """
+
+    # Native connections would bypass the echo guard.
+    native_connections = False
+
     def bind(self, binder, context):
         PulledFrom.bind(self, binder, context)
         PushedTo.bind(self, binder, context)
+        self.echo_guard = _EchoGuard()
+        if self.puller is not None:
+            self.puller.echo_guard = self.echo_guard
+            self.puller.source = 'model'
+        if self.pusher is not None:
+            self.pusher.echo_guard = self.echo_guard
+            self.pusher.source = 'binder'
 
     def unbind(self):
         PushedTo.unbind(self)
@@ -20,3 +20,8 @@ FORCE_NOTIFIERS = 1
 # Some names that are used to store things in the __dict__s of Binders.
 DELAYED_CONNECTION = '<__DelayedConnection__>'
 DELAYED_SETATTR = '<__DelayedSetattr__>'
+PROPERTY_CACHE = '<__PropertyCache__>'
+SIGNAL_DISPATCHER = '<__SignalDispatcher__>'
+BATCHED_SETATTR = '<__BatchedSetattr__>'
+BATCH_STATE = '<__BatchState__>'
+RATE_LIMITS = '<__RateLimits__>'
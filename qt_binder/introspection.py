@@ -0,0 +1,390 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Introspection of Qt classes for the automatic traits of Binders.
+
+Walking the ``QMetaObject`` and the Python attributes of a Qt class is one of
+the more expensive parts of setting up a :class:`~.Binder` class. The results
+only depend on the Qt binding, the Qt version and the Qt class, so they are
+computed once per process and, if a cache directory is configured, persisted
+to disk for later processes.
+"""
+
+import json
+import keyword
+import os
+import tempfile
+
+from .qt import QtCore, qt_api
+
+
+#: The version of the on-disk cache format. Bump this whenever the layout of
+#: the cached data changes.
+CACHE_FORMAT_VERSION = 1
+
+#: The environment variable that configures the on-disk cache directory.
+CACHE_DIR_ENV = 'QT_BINDER_CACHE_DIR'
+
+# The top-level package of the Qt binding, e.g. 'PySide6'. Only classes from
+# the binding itself are persisted. Python subclasses of Qt classes may change
+# between runs without any change to the Qt version.
+_QT_PACKAGE = QtCore.QObject.__module__.split('.')[0]
+
+
+def _to_str(t, encoding='ascii'):
+    if isinstance(t, QtCore.QByteArray):
+        t = t.data().decode(encoding)
+    else:
+        t = str(t)
+    return t
+
+
+def _python_name_for_qt_name(qname):
+    """ Convert forbidden Qt names to valid Python names, following PySide/PyQt
+    rules.
+
+    E.g. 'raise' -> 'raise_'
+    """
+    if keyword.iskeyword(qname):
+        qname += '_'
+    return qname
+
+
+def _get_signature(meta_meth):
+    """ Robustly find the signature of a ``QMetaMethod``.
+    """
+    if hasattr(meta_meth, 'methodSignature'):
+        signature = meta_meth.methodSignature()
+    else:
+        signature = meta_meth.signature()
+    signature = _to_str(signature)
+    return signature
+
+
+def _qt_name_for_meta_method(meta_meth):
+    """ Get the Qt name for a ``QMetaMethod``.
+    """
+    return _get_signature(meta_meth).split('(')[0]
+
+
+def _setter_name(getter_name):
+    """ Convert a getter name to a setter name.
+    """
+    return 'set' + getter_name[0].upper() + getter_name[1:]
+
+
+def _qclass_key(qclass):
+    """ Return a '__module__:__name__' key for a Qt class.
+    """
+    return '{0.__module__}:{0.__name__}'.format(qclass)
+
+
+def _is_method(class_attr):
+    # sip methoddescriptor objects do not have __call__() defined.
+    return (callable(class_attr) or
+            type(class_attr).__name__ == 'methoddescriptor')
+
+
+def _getter_setter_pairs(method_names):
+    """ Pair up ``foo()/setFoo()`` methods.
+
+    Returns a sorted list of ``(getter, setter)`` names.
+    """
+    setters = {name for name in method_names
+               if name.startswith('set') and len(name) > 3}
+    # Undo _setter_name() on each setter. The case of the first letter of the
+    # getter is unknown, so try both.
+    candidates = set()
+    for setter in setters:
+        candidates.add(setter[3].lower() + setter[4:])
+        candidates.add(setter[3:])
+    pairs = []
+    for getter in candidates & method_names:
+        # FIXME: We do not know if these are true getter/setters, where
+        # the getter has 0 arguments and the setter has just the 1. For
+        # example, `QObject.property(name)` and
+        # `QObject.setProperty(name, value)` get misidentified here.
+        # Unfortunately, the method objects do not have any information
+        # about their argument structure.
+        if getter == 'property':
+            continue
+        setter = _setter_name(getter)
+        if setter in setters:
+            pairs.append((getter, setter))
+    pairs.sort()
+    return pairs
+
+
+class QtClassInfo(object):
+    """ The members of a Qt class that can be proxied by automatic traits.
+
+    Members are recorded by their index into the class's ``staticMetaObject``
+    and by their Python names, before any :class:`~.Rename` is applied, so the
+    same information can be shared by every :class:`~.Binder` wrapping the
+    class.
+    """
+
+    def __init__(self, properties=(), methods=(), getter_setters=()):
+        #: ``(index, name)`` pairs of the static Qt properties.
+        self.properties = [tuple(x) for x in properties]
+
+        #: ``(index, name, method_type, arg_types)`` tuples of the signals and
+        #: slots, in ``QMetaObject`` order. The ``method_type`` is either
+        #: ``'signal'`` or ``'slot'``.
+        self.methods = [(index, name, method_type, tuple(arg_types))
+                        for index, name, method_type, arg_types in methods]
+
+        #: ``(getter, setter)`` pairs of method names that look like implied
+        #: properties.
+        self.getter_setters = [tuple(x) for x in getter_setters]
+
+    @classmethod
+    def from_qclass(cls, qclass, base_info=None):
+        """ Introspect a Qt class.
+
+        If the :class:`~.QtClassInfo` of the Qt class that the
+        ``staticMetaObject`` inherits from is given, its properties and
+        methods are reused and only the ones introduced by ``qclass`` are read
+        from the ``QMetaObject``.
+        """
+        meta_object = qclass.staticMetaObject
+        if base_info is None:
+            properties = []
+            methods = []
+            property_start = 0
+            method_start = 0
+        else:
+            properties = list(base_info.properties)
+            methods = list(base_info.methods)
+            property_start = meta_object.propertyOffset()
+            method_start = meta_object.methodOffset()
+
+        for i in range(property_start, meta_object.propertyCount()):
+            meta_prop = meta_object.property(i)
+            properties.append(
+                (i, _python_name_for_qt_name(_to_str(meta_prop.name()))))
+
+        for i in range(method_start, meta_object.methodCount()):
+            meta_meth = meta_object.method(i)
+            method_type = meta_meth.methodType()
+            if method_type == QtCore.QMetaMethod.Slot:
+                method_type = 'slot'
+            elif method_type == QtCore.QMetaMethod.Signal:
+                method_type = 'signal'
+            else:
+                continue
+            name = _python_name_for_qt_name(
+                _qt_name_for_meta_method(meta_meth))
+            arg_types = [_to_str(t) for t in meta_meth.parameterTypes()]
+            methods.append((i, name, method_type, arg_types))
+
+        getter_setters = _getter_setter_pairs(get_method_names(qclass))
+        return cls(properties, methods, getter_setters)
+
+    @classmethod
+    def from_json(cls, data):
+        """ Rebuild from the output of :meth:`to_json`.
+        """
+        return cls(data['properties'], data['methods'],
+                   data['getter_setters'])
+
+    def to_json(self):
+        """ Return a JSON-serializable representation.
+        """
+        return {
+            'properties': [list(x) for x in self.properties],
+            'methods': [[index, name, method_type, list(arg_types)]
+                        for index, name, method_type, arg_types
+                        in self.methods],
+            'getter_setters': [list(x) for x in self.getter_setters],
+        }
+
+
+class IntrospectionCache(object):
+    """ On-disk cache of :class:`~.QtClassInfo`.
+
+    Entries are stored one file per Qt class under a subdirectory that names
+    the cache format version, the Qt binding, the binding's version and the Qt
+    version, so upgrading any of them simply starts a fresh cache.
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def path_for(self, qclass):
+        """ Return the path of the cache file for a Qt class.
+        """
+        version_dir = '{0}-{1}-qt{2}'.format(
+            qt_api, QtCore.__version__, QtCore.qVersion())
+        filename = '{0.__module__}.{0.__name__}.json'.format(qclass)
+        return os.path.join(
+            self.directory, 'v{0}'.format(CACHE_FORMAT_VERSION), version_dir,
+            filename)
+
+    def is_cacheable(self, qclass):
+        """ Only classes from the Qt binding itself are persisted.
+        """
+        return qclass.__module__.startswith(_QT_PACKAGE + '.')
+
+    def load(self, qclass):
+        """ Load the cached information for a Qt class.
+
+        Returns ``None`` if there is no valid entry.
+        """
+        if not self.is_cacheable(qclass):
+            return None
+        try:
+            with open(self.path_for(qclass)) as f:
+                data = json.load(f)
+            if data['header'] != self._header(qclass):
+                return None
+            return QtClassInfo.from_json(data['info'])
+        except (OSError, ValueError, KeyError, TypeError):
+            # Missing, unreadable or corrupt. Just introspect again.
+            return None
+
+    def save(self, qclass, info):
+        """ Save the information for a Qt class.
+
+        Failure to write the cache is not an error.
+        """
+        if not self.is_cacheable(qclass):
+            return
+        path = self.path_for(qclass)
+        data = {'header': self._header(qclass), 'info': info.to_json()}
+        dirname = os.path.dirname(path)
+        try:
+            os.makedirs(dirname, exist_ok=True)
+            # Write to a temporary file and rename it so concurrent processes
+            # never see a partially-written entry.
+            fd, tmp_path = tempfile.mkstemp(dir=dirname, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, path)
+            except Exception:
+                os.unlink(tmp_path)
+                raise
+        except OSError:
+            pass
+
+    def _header(self, qclass):
+        return {
+            'format': CACHE_FORMAT_VERSION,
+            'qt_api': qt_api,
+            'binding_version': QtCore.__version__,
+            'qt_version': QtCore.qVersion(),
+            'qclass': _qclass_key(qclass),
+        }
+
+
+#: The on-disk cache, if one is configured.
+_disk_cache = None
+
+#: Process-wide QtClassInfo for each Qt class.
+_class_infos = {}
+
+#: Process-wide names of the methods of each Qt class.
+_method_names = {}
+
+
+def set_cache_directory(directory):
+    """ Configure the directory of the on-disk introspection cache.
+
+    Pass ``None`` to disable the on-disk cache. By default, the directory is
+    taken from the ``QT_BINDER_CACHE_DIR`` environment variable, if it is set.
+    """
+    global _disk_cache
+    if directory is None:
+        _disk_cache = None
+    else:
+        _disk_cache = IntrospectionCache(directory)
+
+
+def get_cache_directory():
+    """ Return the directory of the on-disk introspection cache, if any.
+    """
+    if _disk_cache is None:
+        return None
+    return _disk_cache.directory
+
+
+def get_method_names(qclass):
+    """ Return the names of the methods of a Qt class, including inherited
+    ones.
+
+    The result is a ``frozenset`` computed once per process for each class.
+    Each class only looks at its own ``__dict__`` and reuses the names of its
+    Qt base classes.
+    """
+    names = _method_names.get(qclass)
+    if names is None:
+        names = set()
+        for base in qclass.__bases__:
+            if issubclass(base, QtCore.QObject):
+                names.update(get_method_names(base))
+            else:
+                # Non-QObject mixins like QLayoutItem also provide methods.
+                names.update(
+                    name for name in dir(base)
+                    if not name.startswith('__') and
+                    _is_method(getattr(qclass, name)))
+        for name in vars(qclass):
+            if name.startswith('__'):
+                continue
+            # Look the name up through the class to get what instances see.
+            if _is_method(getattr(qclass, name)):
+                names.add(name)
+            else:
+                names.discard(name)
+        names = frozenset(names)
+        _method_names[qclass] = names
+    return names
+
+
+def _meta_base_class(qclass):
+    """ Find the Qt class whose ``staticMetaObject`` is the super class of
+    ``qclass``'s, if it is available.
+    """
+    super_meta = qclass.staticMetaObject.superClass()
+    if super_meta is None:
+        return None
+    name = _to_str(super_meta.className())
+    for base in qclass.__mro__[1:]:
+        if (issubclass(base, QtCore.QObject) and
+                _to_str(base.staticMetaObject.className()) == name):
+            return base
+    return None
+
+
+def get_class_info(qclass):
+    """ Return the :class:`~.QtClassInfo` for a Qt class.
+
+    The information is computed at most once per process and is read from and
+    written to the on-disk cache, if one is configured. The Qt base classes
+    are introspected first so that only the members each class adds to its
+    ``QMetaObject`` are read.
+    """
+    info = _class_infos.get(qclass)
+    if info is None:
+        disk_cache = _disk_cache
+        if disk_cache is not None:
+            info = disk_cache.load(qclass)
+        if info is None:
+            base = _meta_base_class(qclass)
+            base_info = None if base is None else get_class_info(base)
+            info = QtClassInfo.from_qclass(qclass, base_info)
+            if disk_cache is not None:
+                disk_cache.save(qclass, info)
+        _class_infos[qclass] = info
+    return info
+
+
+set_cache_directory(os.environ.get(CACHE_DIR_ENV) or None)
@@ -8,33 +8,205 @@
 #
 # Thanks for using Enthought open source!
 
-from . import is_qt4, qt_api
+""" Load Qt Designer `.ui` files.
 
-if qt_api.startswith('pyqt'):
-    def load_ui(path):
-        from collections import Counter
+:func:`load_ui` compiles each file once into a :class:`UiTemplate`, the
+Python code that ``uic`` generates for it, and builds later instances by
+running that code again without reading the file. The template is rebuilt
+when the modification time or size of the file changes. Files that cannot be
+compiled, e.g. because ``uic`` is not available, are loaded by the Qt loader
+every time.
+
+The names to be bound are the same as with the Qt loader of the binding: on
+PySide, all of the named widgets and layouts in the file, from the file; on
+PyQt, the named direct children of the root widget, including actions, from
+each new instance.
+"""
+
+from collections import Counter
+import io
+import logging
+import os
+import subprocess
+from xml.etree import ElementTree
+
+from . import QtGui, is_qt4, qt_api
+
+
+logger = logging.getLogger(__name__)
+
+# {absolute path: ((mtime, size), UiTemplate or None)}
+_templates = {}
+
+
+class UiTemplate(object):
+    """ A compiled `.ui` file that builds new instances of its widgets.
+    """
+
+    def __init__(self, root_class, ui_class, names):
+        #: The class of the root widget.
+        self.root_class = root_class
+
+        #: The generated ``Ui_*`` class whose ``setupUi()`` builds the
+        #: children of the root widget.
+        self.ui_class = ui_class
+
+        #: The names of the child widgets and layouts to be bound, or None to
+        #: take them from the children of each instance.
+        self.names = names
+
+    @classmethod
+    def from_file(cls, path):
+        """ Compile a `.ui` file.
+        """
+        tree = ElementTree.parse(path)
+        root = tree.getroot().find('widget')
+        root_class = getattr(QtGui, root.get('class'))
+        if qt_api.startswith('pyqt'):
+            names = None
+        else:
+            names = _names_to_be_bound(root)
+        namespace = {}
+        exec(compile(_ui_source(path), path, 'exec'), namespace)
+        ui_class = namespace['Ui_' + tree.getroot().findtext('class')]
+        return cls(root_class, ui_class, names)
+
+    def instantiate(self):
+        """ Build a new root widget and its children.
+
+        Returns
+        -------
+        ui : QWidget
+            The root widget.
+        names : list of str
+            The names of the child widgets and layouts to be bound.
+        """
+        ui = self.root_class()
+        self.ui_class().setupUi(ui)
+        if self.names is None:
+            return ui, _names_of_children(ui)
+        return ui, list(self.names)
+
+
+def _unique_public_names(names_hist):
+    return [name for name, count in names_hist.items()
+            if count == 1 and not name.startswith('_')]
+
+
+def _names_to_be_bound(root):
+    """ Return the names of the widgets and layouts of a `.ui` file, as the
+    PySide loader records them.
+    """
+    names = Counter(element.get('name') for element in root.iter()
+                    if element.tag in ('widget', 'layout') and
+                    element.get('name'))
+    # Exclude the root object from this list as it is always bound to the
+    # UIFile itself.
+    names.pop(root.get('name'), None)
+    return _unique_public_names(names)
+
+
+def _names_of_children(ui):
+    """ Return the names of the direct children of a widget, as the PyQt
+    loader finds them.
+    """
+    names_hist = Counter()
+    for child in ui.children():
+        name = child.objectName()
+        if name:
+            names_hist[name] += 1
+    return _unique_public_names(names_hist)
+
+
+def _ui_source(path):
+    """ Return the Python source that ``uic`` generates for a `.ui` file.
+    """
+    if qt_api.startswith('pyqt'):
         if is_qt4:
             from PyQt4 import uic
         else:
             from PyQt5 import uic
+        source = io.StringIO()
+        uic.compileUi(path, source)
+        return source.getvalue()
+    elif qt_api == 'pyside':
+        from pysideuic import compileUi
+        source = io.StringIO()
+        compileUi(path, source)
+        return source.getvalue()
+    elif qt_api == 'pyside2':
+        import PySide2 as package
+    elif qt_api == 'pyside6':
+        import PySide6 as package
+    else:
+        raise RuntimeError(f"Unrecognized qt_api = {qt_api!r}")
+    package_dir = os.path.dirname(package.__file__)
+    for exe in (os.path.join(package_dir, 'Qt', 'libexec', 'uic'),
+                os.path.join(package_dir, 'uic'),
+                os.path.join(package_dir, 'uic.exe')):
+        if os.path.isfile(exe):
+            break
+    else:
+        raise RuntimeError(f"uic not found in {package_dir!r}")
+    return subprocess.check_output(
+        [exe, '-g', 'python', path]).decode('utf-8')
 
-        ui = uic.loadUi(path)
-        names_hist = Counter()
-        for child in ui.children():
-            name = child.objectName()
-            if name:
-                names_hist[name] += 1
 
-        names = []
-        for name, count in names_hist.items():
-            if count == 1 and not name.startswith('_'):
-                names.append(name)
+def get_ui_template(path):
+    """ Return the compiled template of a `.ui` file.
 
-        return ui, names
+    The template is cached by the path, modification time and size of the
+    file. Returns ``None`` if the file cannot be compiled.
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    entry = _templates.get(path)
+    if entry is None or entry[0] != stamp:
+        try:
+            template = UiTemplate.from_file(path)
+        except Exception:
+            logger.debug('Could not compile %r; loading it each time.', path,
+                         exc_info=True)
+            template = None
+        entry = _templates[path] = (stamp, template)
+    return entry[1]
+
+
+def clear_ui_templates():
+    """ Forget the compiled templates of all `.ui` files.
+    """
+    _templates.clear()
+
+
+def load_ui(path):
+    """ Load a `.ui` file.
+
+    Returns
+    -------
+    ui : QWidget
+        The root widget.
+    names : list of str
+        The names of the child widgets and layouts to be bound.
+    """
+    template = get_ui_template(path)
+    if template is None:
+        return _load_ui_uncached(path)
+    return template.instantiate()
+
+
+if qt_api.startswith('pyqt'):
+    def _load_ui_uncached(path):
+        if is_qt4:
+            from PyQt4 import uic
+        else:
+            from PyQt5 import uic
+
+        ui = uic.loadUi(path)
+        return ui, _names_of_children(ui)
 
 else:
-    def load_ui(path):
-        from collections import Counter
+    def _load_ui_uncached(path):
         if qt_api == 'pyside':
             from PySide.QtUiTools import QUiLoader
         elif qt_api == 'pyside2':
@@ -0,0 +1,88 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Coalesce the stylesheet re-evaluations of widgets.
+
+Assigning to a styled :class:`~.QtDynamicProperty` needs the widget to be
+repolished for the stylesheet rules to see the new value. Rather than doing
+that for every assignment, the :data:`restyle_scheduler` marks the widget as
+dirty and repolishes each dirty widget once on the next iteration of the event
+loop.
+"""
+
+from .qt import QtCore
+
+
+class RestyleScheduler(object):
+    """ Repolish dirty widgets once per event loop iteration.
+    """
+
+    def __init__(self):
+        #: If False, widgets are repolished immediately when they are marked.
+        self.enabled = True
+
+        #: The number of restyles that were requested.
+        self.n_requested = 0
+
+        #: The number of restyles that were done.
+        self.n_polished = 0
+
+        # The dirty widgets, by id, in the order they were first marked.
+        self._dirty = {}
+        self._scheduled = False
+
+    @property
+    def n_saved(self):
+        """ The number of restyles that were avoided by coalescing.
+        """
+        return self.n_requested - self.n_polished - len(self._dirty)
+
+    def schedule(self, widget):
+        """ Mark a widget to be repolished.
+        """
+        self.n_requested += 1
+        if not self.enabled:
+            self._polish(widget)
+            return
+        self._dirty[id(widget)] = widget
+        if not self._scheduled:
+            self._scheduled = True
+            QtCore.QTimer.singleShot(0, self.flush)
+
+    def flush(self):
+        """ Repolish the dirty widgets now.
+        """
+        dirty = self._dirty
+        self._dirty = {}
+        self._scheduled = False
+        for widget in dirty.values():
+            try:
+                self._polish(widget)
+            except RuntimeError:
+                # The underlying C++ object was deleted in the meantime.
+                pass
+
+    def reset_counters(self):
+        """ Reset the restyle counters.
+        """
+        self.n_requested = len(self._dirty)
+        self.n_polished = 0
+
+    #### Private protocol #####################################################
+
+    def _polish(self, widget):
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        self.n_polished += 1
+
+
+#: The scheduler used by styled QtDynamicProperty traits.
+restyle_scheduler = RestyleScheduler()
@@ -0,0 +1,196 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Ahead-of-time generation of the automatic traits of Binder classes.
+
+Run this module as a script to write one plain Python module per
+:class:`~.Binder` class into a package directory::
+
+    python -m qt_binder.static_traits --qt-api pyside6 -o myapp/qt_traits \\
+        --registry myapp.widgets:NameField
+
+Each generated module declares the automatic traits of its class as a table
+and records the Qt binding, binding version and Qt version it was generated
+for. Point the application at the package with
+:func:`~.set_static_traits_package` or the ``QT_BINDER_STATIC_TRAITS``
+environment variable before instantiating any Binders. Classes without a
+matching module, or whose module was built for a different Qt, fall back to
+runtime introspection.
+
+The Qt binding is imported lazily so that the script can choose it.
+"""
+
+import argparse
+import importlib
+import os
+import pprint
+import sys
+
+
+#: The version of the generated module format.
+STATIC_TRAITS_FORMAT_VERSION = 1
+
+#: The environment variable naming the package of generated modules.
+STATIC_TRAITS_ENV = 'QT_BINDER_STATIC_TRAITS'
+
+_TEMPLATE = '''\
+# Automatically generated by qt_binder.static_traits. Do not edit.
+#
+# Automatic traits of {binder_key} for {qt_api} {binding_version}
+# (Qt {qt_version}).
+
+HEADER = {header}
+
+RENAMINGS = {renamings}
+
+QT_TRAITS = {table}
+'''
+
+#: The package containing the generated modules, if any.
+_package = os.environ.get(STATIC_TRAITS_ENV) or None
+
+
+def set_static_traits_package(package):
+    """ Set the package to load generated trait modules from.
+
+    Pass ``None`` to always introspect at runtime.
+    """
+    global _package
+    _package = package
+
+
+def get_static_traits_package():
+    """ Return the package that generated trait modules are loaded from.
+    """
+    return _package
+
+
+def module_name_for(binder_class):
+    """ Return the name of the generated module for a Binder class, without
+    the package.
+    """
+    return '{0}__{1}'.format(
+        binder_class.__module__.replace('.', '_'), binder_class.__name__)
+
+
+def _header(binder_class):
+    from .qt import QtCore, qt_api
+    return {
+        'format': STATIC_TRAITS_FORMAT_VERSION,
+        'qt_api': qt_api,
+        'binding_version': QtCore.__version__,
+        'qt_version': QtCore.qVersion(),
+        'binder_class': '{0.__module__}:{0.__name__}'.format(binder_class),
+        'qclass': '{0.__module__}:{0.__name__}'.format(binder_class.qclass),
+    }
+
+
+def load_static_qt_traits(binder_class, renamings):
+    """ Load the generated trait table of a Binder class.
+
+    Returns ``None`` if there is no generated module, or if it was generated
+    for a different Qt or with different renamings.
+    """
+    if _package is None:
+        return None
+    name = '{0}.{1}'.format(_package, module_name_for(binder_class))
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        return None
+    if (getattr(module, 'HEADER', None) != _header(binder_class) or
+            getattr(module, 'RENAMINGS', None) != renamings):
+        return None
+    return module.QT_TRAITS
+
+
+def generate_source(binder_class):
+    """ Return the source of the generated module for a Binder class.
+    """
+    renamings = binder_class._collect_renamings()
+    # Ignore the traits declared on the class. They are skipped when the table
+    # is loaded, so the table stays valid if the class changes them.
+    table = binder_class._build_qt_trait_table(renamings, set())
+    header = _header(binder_class)
+    return _TEMPLATE.format(
+        binder_key=header['binder_class'],
+        qt_api=header['qt_api'],
+        binding_version=header['binding_version'],
+        qt_version=header['qt_version'],
+        header=pprint.pformat(header),
+        renamings=pprint.pformat(renamings),
+        table=pprint.pformat(table),
+    )
+
+
+def write_modules(binder_classes, output_dir):
+    """ Write the generated modules of Binder classes into a package
+    directory.
+
+    Returns the list of paths written.
+    """
+    if not os.path.isdir(output_dir):
+        os.makedirs(output_dir)
+    init = os.path.join(output_dir, '__init__.py')
+    if not os.path.exists(init):
+        with open(init, 'w'):
+            pass
+    paths = []
+    for binder_class in binder_classes:
+        path = os.path.join(output_dir,
+                            module_name_for(binder_class) + '.py')
+        with open(path, 'w') as f:
+            f.write(generate_source(binder_class))
+        paths.append(path)
+    return paths
+
+
+def _import_binder_class(key):
+    module, name = key.split(':')
+    return getattr(importlib.import_module(module), name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m qt_binder.static_traits',
+        description='Generate modules with the automatic traits of Binder '
+                    'classes.')
+    parser.add_argument(
+        'binder_classes', nargs='*', metavar='MODULE:CLASS',
+        help='Binder classes to generate modules for.')
+    parser.add_argument(
+        '-o', '--output-dir', required=True,
+        help='The package directory to write the modules into.')
+    parser.add_argument(
+        '--registry', action='store_true',
+        help='Also generate modules for every Binder in binder_registry.')
+    parser.add_argument(
+        '--qt-api', help='The Qt binding to use, e.g. pyside6 or pyqt5.')
+    args = parser.parse_args(argv)
+
+    if args.qt_api:
+        os.environ['QT_API'] = args.qt_api
+    from .qt import QtGui
+    # Some Qt classes need an application to be introspected.
+    app = QtGui.QApplication.instance() or QtGui.QApplication([])  # noqa
+
+    binder_classes = [_import_binder_class(key)
+                      for key in args.binder_classes]
+    if args.registry:
+        from .warm_up import registered_binder_classes
+        binder_classes.extend(
+            binder_class for binder_class in registered_binder_classes()
+            if binder_class not in binder_classes)
+    for path in write_modules(binder_classes, args.output_dir):
+        print(path)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
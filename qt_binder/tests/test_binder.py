@@ -8,16 +8,22 @@
 #
 # Thanks for using Enthought open source!
 
+import enum
+import operator
 import unittest
 
 import six
 
-from traits.api import Bool, Instance, pop_exception_handler, \
-    push_exception_handler
+from traits.api import ABCHasTraits, Bool, ComparisonMode, Instance, \
+    NO_COMPARE, pop_exception_handler, push_exception_handler
 
-from ..binder import Binder, Composite, Default, QtDynamicProperty, \
-    QtGetterSetter, QtProperty, QtSignal, QtSlot, Rename
+from ..binder import QWIDGET_BASICS, VALUE_COMPARATORS, Binder, Composite, \
+    Default, QtDynamicProperty, QtGetterSetter, QtProperty, QtSignal, \
+    QtSlot, RateLimit, Rename, _comparator_for, _equal
+from ..constants import BATCH_STATE, BATCHED_SETATTR, PROPERTY_CACHE, \
+    SIGNAL_DISPATCHER
 from ..qt import QtCore, QtGui
+from ..testing import BaseTestWithGui
 
 
 class TestBinder(unittest.TestCase):
@@ -277,3 +283,485 @@ class TestBinder(unittest.TestCase):
             self.assertEqual(w.what_is_this, u'Bar')
             self.assertEqual(w.qobj.whatsThis(), u'Bar')
             w.dispose()
+
+    def test_lazy_qt_traits(self):
+        class Widget(Binder):
+            qclass = QtGui.QWidget
+            lazy_qt_traits = True
+
+            accessibleName = Default(u'blah')
+            what_is_this = Rename('whatsThis', default=u'Foo')
+
+        w = Widget()
+        traits = Widget.class_traits()
+        self.assertNotIn('windowTitle', traits)
+        self.assertNotIn('setFocus', traits)
+        self.assertNotIn('windowTitleChanged', traits)
+        self.assertNotIn('parent', traits)
+
+        # Listening to a trait creates it.
+        received = []
+        w.on_trait_change(lambda new: received.append(new),
+                          'windowTitleChanged')
+        self.assertIsInstance(
+            Widget.class_traits()['windowTitleChanged'].trait_type, QtSignal)
+
+        # Assigning to a trait creates it.
+        w.windowTitle = u'title'
+        self.assertIsInstance(
+            Widget.class_traits()['windowTitle'].trait_type, QtProperty)
+
+        w.construct()
+        self.assertEqual(w.qobj.windowTitle(), u'title')
+        self.assertEqual(w.accessibleName, u'blah')
+        self.assertEqual(w.what_is_this, u'Foo')
+        self.assertEqual(w.qobj.whatsThis(), u'Foo')
+        self.assertNotIn('whatsThis', Widget.class_traits())
+
+        # Getting a trait creates it.
+        self.assertIsNone(w.parent)
+        self.assertIsInstance(
+            Widget.class_traits()['parent'].trait_type, QtGetterSetter)
+
+        w.windowTitle = u'other'
+        self.assertEqual(received, [u'title', u'other'])
+        self.assertNotIn('setFocus', Widget.class_traits())
+        with self.assertRaises(AttributeError):
+            w.whatsThis
+        with self.assertRaises(AttributeError):
+            w.not_a_qt_member
+        w.dispose()
+
+    def test_share_ancestor_traits(self):
+        class Widget(Binder):
+            qclass = QtGui.QWidget
+
+        class LineEdit(Widget):
+            qclass = QtGui.QLineEdit
+
+            title = Rename('windowTitle')
+
+        class SubLineEdit(LineEdit):
+            pass
+
+        Widget()
+        LineEdit()
+        SubLineEdit()
+        widget_traits = Widget.class_traits()
+        line_edit_traits = LineEdit.class_traits()
+        sub_traits = SubLineEdit.class_traits()
+        self.assertIs(line_edit_traits['objectName'],
+                      widget_traits['objectName'])
+        self.assertIs(line_edit_traits['title'],
+                      widget_traits['windowTitle'])
+        self.assertIsInstance(line_edit_traits['text'].trait_type, QtProperty)
+        self.assertNotIn('text', widget_traits)
+        self.assertIs(sub_traits['text'], line_edit_traits['text'])
+        self.assertIs(sub_traits['title'], line_edit_traits['title'])
+
+        le = LineEdit()
+        le.construct()
+        le.title = u'title'
+        self.assertEqual(le.qobj.windowTitle(), u'title')
+        le.text = u'text'
+        self.assertEqual(le.qobj.text(), u'text')
+        le.dispose()
+
+    def test_class_tables_invalidated(self):
+        class Widget(Binder):
+            qclass = QtGui.QWidget
+
+            accessibleName = Default(u'blah')
+
+        w = Widget()
+        w.construct()
+        self.assertEqual(w.accessibleName, u'blah')
+        self.assertIs(Widget._binder_class_tables(),
+                      Widget._binder_class_tables())
+
+        class SubWidget(Widget):
+            pass
+
+        SubWidget._binder_class_tables()
+
+        # Changing the class is picked up by the class and its subclasses.
+        Widget.accessibleName = Default(u'other')
+        Widget.clear_class_cache()
+        Widget.add_class_trait('dyn', QtDynamicProperty(5))
+        for cls in [Widget, SubWidget]:
+            w = cls()
+            w.construct()
+            self.assertEqual(w.accessibleName, u'other')
+            self.assertEqual(w.qobj.property('dyn'), 5)
+
+        del Widget.accessibleName
+        Widget.clear_class_cache()
+        w = Widget()
+        w.construct()
+        self.assertEqual(w.accessibleName, u'')
+
+    def test_mixed_metaclass(self):
+        # Binder keeps the metaclass of HasTraits, so it can be mixed with
+        # other HasTraits classes.
+        class AbstractWidget(Binder, ABCHasTraits):
+            qclass = QtGui.QWidget
+
+            accessibleName = Default(u'blah')
+
+        w = AbstractWidget()
+        w.construct()
+        self.assertEqual(w.accessibleName, u'blah')
+        w.dispose()
+
+    def test_instance_dynamic_property(self):
+        obj = self.Object()
+        obj.add_trait('y', QtDynamicProperty(5))
+        obj.construct()
+        self.assertEqual(obj.qobj.property('x'), 10)
+        self.assertEqual(obj.qobj.property('y'), 5)
+
+    def test_qt_trait_names(self):
+        class LineEdit(Binder):
+            qclass = QtGui.QLineEdit
+            qt_trait_names = QWIDGET_BASICS + ('text', 'textChanged')
+
+            placeholderText = Default(u'blah')
+            what_is_this = Rename('whatsThis', default=u'Foo')
+
+        w = LineEdit()
+        traits = LineEdit.class_traits()
+        for name in ('text', 'textChanged', 'enabled', 'setFocus',
+                     'placeholderText', 'what_is_this'):
+            self.assertIn(name, traits)
+        for name in ('readOnly', 'returnPressed', 'windowTitle', 'parent',
+                     'whatsThis'):
+            self.assertNotIn(name, traits)
+
+        w.text = u'text'
+        w.construct()
+        self.assertEqual(w.qobj.text(), u'text')
+        self.assertEqual(w.qobj.placeholderText(), u'blah')
+        self.assertEqual(w.qobj.whatsThis(), u'Foo')
+
+    def test_precomputed_accessors(self):
+        class Widget(Binder):
+            qclass = QtGui.QWidget
+
+        Widget()
+        traits = {k: v.trait_type for k, v in Widget.class_traits().items()}
+        self.assertEqual(traits['setFocus'].python_name, 'setFocus')
+        self.assertEqual(traits['windowTitle'].setter_name, 'setWindowTitle')
+        self.assertEqual(traits['windowTitle'].signal_accessor,
+                         ('windowTitleChanged', ('QString',)))
+        self.assertEqual(traits['destroyed_QObject'].signal_accessor,
+                         ('destroyed', ('QObject*',)))
+        self.assertEqual(traits['destroyed'].signal_accessor[0], 'destroyed')
+
+    def test_cached_qt_properties(self):
+        class LineEdit(Binder):
+            qclass = QtGui.QLineEdit
+            cached_qt_properties = frozenset(['text', 'modified'])
+
+        w = LineEdit()
+        w.construct()
+        w.qobj.setText(u'one')
+        self.assertEqual(w.text, u'one')
+        self.assertEqual(w.__dict__[PROPERTY_CACHE], {'text': u'one'})
+        self.assertEqual(w.text, u'one')
+
+        # The notify signal drops the cached value.
+        w.qobj.setText(u'two')
+        self.assertNotIn('text', w.__dict__[PROPERTY_CACHE])
+        self.assertEqual(w.text, u'two')
+
+        # So does assigning to the trait, even with the signals blocked.
+        w.qobj.blockSignals(True)
+        w.text = u'three'
+        w.qobj.blockSignals(False)
+        self.assertEqual(w.text, u'three')
+
+        # Properties without a notify signal are not cached.
+        self.assertFalse(w.modified)
+        self.assertNotIn('modified', w.__dict__[PROPERTY_CACHE])
+
+        # Listeners still work.
+        received = []
+        w.on_trait_change(lambda new: received.append(new), 'text')
+        w.qobj.setText(u'four')
+        self.assertEqual(received, [u'four'])
+        self.assertEqual(w.text, u'four')
+
+        w.dispose()
+        self.assertNotIn(PROPERTY_CACHE, w.__dict__)
+        w.qobj.setText(u'five')
+        self.assertEqual(w.text, u'five')
+
+    def test_unchanged_property_not_written(self):
+        class Label(Binder):
+            qclass = QtGui.QLabel
+
+        w = Label()
+        w.construct()
+        received = []
+
+        def listener(obj, name, new):
+            received.append(name)
+
+        w.on_trait_change(listener, 'text,font')
+        w.text = u'one'
+        w.text = u'one'
+        self.assertEqual(received, ['text'])
+
+        # Equal Qt values are compared with their comparator.
+        w.font = QtGui.QFont(w.font)
+        self.assertEqual(received, ['text'])
+        font = QtGui.QFont(w.font)
+        font.setBold(not font.bold())
+        w.font = font
+        self.assertEqual(received, ['text', 'font'])
+        w.dispose()
+
+    def test_property_comparison_mode(self):
+        class Label(Binder):
+            qclass = QtGui.QLabel
+
+        w = Label()
+        w.construct()
+        received = []
+
+        def listener(obj, name, new):
+            received.append(name)
+
+        # The automatic traits compare by equality.
+        self.assertEqual(w.trait('text').trait_type.comparison_mode,
+                         ComparisonMode.equality)
+
+        # A QtProperty added by hand respects its comparison_mode metadata.
+        meta_object = QtGui.QLabel.staticMetaObject
+        meta_prop = meta_object.property(meta_object.indexOfProperty('text'))
+        w.add_trait('always_text',
+                    QtProperty(meta_prop, comparison_mode=NO_COMPARE))
+        w.add_trait('identical_text',
+                    QtProperty(meta_prop,
+                               comparison_mode=ComparisonMode.identity))
+        w.on_trait_change(listener, 'always_text,identical_text')
+        w.text = u'one'
+        w.always_text = u'one'
+        self.assertEqual(received, ['always_text'])
+        # Equal but distinct values are written under identity comparison.
+        w.identical_text = u'two'
+        w.identical_text = u''.join([u'tw', u'o'])
+        self.assertEqual(received,
+                         ['always_text', 'identical_text', 'identical_text'])
+        w.dispose()
+
+    def test_comparators_not_memoized(self):
+        class Color(enum.Enum):
+            red = 1
+
+        class Value(object):
+            pass
+
+        registered = dict(VALUE_COMPARATORS)
+        self.assertIs(_comparator_for(Color), operator.eq)
+        self.assertIs(_comparator_for(Value), _equal)
+        self.assertIs(_comparator_for(QtGui.QFont), operator.eq)
+        self.assertEqual(VALUE_COMPARATORS, registered)
+
+    def test_batch(self):
+        class LineEdit(Binder):
+            qclass = QtGui.QLineEdit
+
+            flag = QtDynamicProperty(False, styled=False)
+
+        class Form(Composite):
+            qclass = QtGui.QWidget
+            first = Instance(LineEdit)
+            second = Instance(LineEdit)
+
+        form = Form(first=LineEdit(), second=LineEdit())
+        form.construct()
+        form.first.construct(form.qobj)
+        form.second.construct(form.qobj)
+        texts = []
+        form.first.on_trait_change(lambda new: texts.append(new), 'text')
+        flags = []
+        form.first.on_trait_change(lambda new: flags.append(new), 'flag')
+
+        with form.batch():
+            self.assertFalse(form.qobj.updatesEnabled())
+            form.first.text = u'one'
+            form.first.text = u'two'
+            form.first.flag = True
+            form.second.maxLength = 5
+            self.assertEqual(form.first.text, u'two')
+            self.assertEqual(form.first.qobj.text(), u'')
+            self.assertTrue(form.first.flag)
+            self.assertEqual(form.second.maxLength, 5)
+            with form.first.batch():
+                form.first.text = u'three'
+            self.assertEqual(form.first.qobj.text(), u'')
+            self.assertEqual(texts, [])
+        self.assertTrue(form.qobj.updatesEnabled())
+        self.assertEqual(form.first.qobj.text(), u'three')
+        self.assertEqual(form.second.qobj.maxLength(), 5)
+        self.assertEqual(texts, [u'three'])
+        self.assertEqual(flags, [True])
+
+        # Slots see the values assigned before them.
+        with form.batch():
+            form.first.text = u'four'
+            form.first.selectAll = True
+            self.assertEqual(form.first.qobj.selectedText(), u'four')
+            form.first.text = u'five'
+        self.assertEqual(texts, [u'three', u'four', u'five'])
+
+        # Assignments are written even if the block raises.
+        with self.assertRaises(ZeroDivisionError):
+            with form.batch():
+                form.first.text = u'six'
+                1 / 0
+        self.assertEqual(form.first.qobj.text(), u'six')
+        self.assertTrue(form.qobj.updatesEnabled())
+
+        # A failing write does not leave the other Binders batched.
+        with self.assertRaises(TypeError):
+            with form.batch():
+                form.first.maxLength = 'not a number'
+                form.second.text = u'seven'
+        self.assertEqual(form.second.qobj.text(), u'seven')
+        for binder in form:
+            self.assertNotIn(BATCH_STATE, binder.__dict__)
+            self.assertNotIn(BATCHED_SETATTR, binder.__dict__)
+        form.second.text = u'after'
+        self.assertEqual(form.second.qobj.text(), u'after')
+        self.assertTrue(form.qobj.updatesEnabled())
+
+    def test_shared_signal_connection(self):
+        class LineEdit(Binder):
+            qclass = QtGui.QLineEdit
+            cached_qt_properties = frozenset(['text'])
+
+        w = LineEdit()
+        w.construct()
+        texts = []
+        changes = []
+
+        def on_text(new):
+            # The cached value is already up to date.
+            texts.append((new, w.text))
+
+        w.on_trait_change(on_text, 'text')
+        w.on_trait_change(lambda new: changes.append(new), 'textChanged')
+        self.assertEqual(w.text, u'')
+        dispatcher = w.__dict__[SIGNAL_DISPATCHER]
+        # One Qt connection for both traits and the cache.
+        self.assertEqual(len(dispatcher.connections), 1)
+
+        w.qobj.setText(u'one')
+        self.assertEqual(texts, [(u'one', u'one')])
+        self.assertEqual(changes, [u'one'])
+
+        w.on_trait_change(on_text, 'text', remove=True)
+        w.qobj.setText(u'two')
+        self.assertEqual(len(texts), 1)
+        self.assertEqual(changes, [u'one', u'two'])
+        self.assertEqual(len(dispatcher.connections), 1)
+
+        w.dispose()
+        self.assertEqual(dispatcher.connections, {})
+        self.assertNotIn(SIGNAL_DISPATCHER, w.__dict__)
+        w.qobj.setText(u'three')
+        self.assertEqual(changes, [u'one', u'two'])
+
+
+class Slider(Binder):
+    qclass = QtGui.QSlider
+
+    valueChanged = RateLimit(latest_only=True)
+    sliderMoved = RateLimit(debounce=50)
+
+
+class TestRateLimit(BaseTestWithGui, unittest.TestCase):
+
+    def make_slider(self, name):
+        slider = Slider()
+        slider.construct()
+        slider.qobj.setRange(0, 100)
+        values = []
+        slider.on_trait_change(lambda new: values.append(new), name)
+        return slider, values
+
+    def test_latest_only(self):
+        slider, values = self.make_slider('valueChanged')
+        for value in range(1, 6):
+            slider.qobj.setValue(value)
+        self.assertEqual(values, [])
+        self.event_loop_helper.event_loop_until_condition(lambda: values)
+        self.assertEqual(values, [5])
+        # Other traits on the same signal are not limited.
+        self.assertEqual(slider.value, 5)
+
+    def test_debounce(self):
+        slider, values = self.make_slider('sliderMoved')
+        for value in range(1, 6):
+            slider.qobj.sliderMoved.emit(value)
+        self.event_loop_helper.event_loop()
+        self.assertEqual(values, [])
+        self.event_loop_helper.event_loop_until_condition(lambda: values)
+        self.assertEqual(values, [5])
+
+    def test_throttle(self):
+        slider = Slider()
+        slider.set_rate_limit('value', throttle=1000)
+        slider.construct()
+        values = []
+        slider.on_trait_change(lambda new: values.append(new), 'value')
+        for value in range(1, 6):
+            slider.qobj.setValue(value)
+        # The first value is sent immediately and the last one later.
+        self.assertEqual(values, [1])
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: len(values) == 2, timeout=5.0)
+        self.assertEqual(values, [1, 5])
+
+    def test_instance_override(self):
+        slider, values = self.make_slider('valueChanged')
+        slider.set_rate_limit('valueChanged', latest_only=False)
+        slider.qobj.setValue(1)
+        slider.qobj.setValue(2)
+        self.assertEqual(values, [1, 2])
+        # Back to the class limits.
+        slider.set_rate_limit('valueChanged')
+        slider.qobj.setValue(3)
+        slider.qobj.setValue(4)
+        self.assertEqual(values, [1, 2])
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: len(values) == 3)
+        self.assertEqual(values, [1, 2, 4])
+
+    def test_metadata(self):
+        meta_object = QtGui.QLineEdit.staticMetaObject
+
+        class LineEdit(Binder):
+            qclass = QtGui.QLineEdit
+            flag = QtProperty(
+                meta_object.property(meta_object.indexOfProperty('text')),
+                latest_only=True)
+
+        line_edit = LineEdit()
+        line_edit.construct()
+        values = []
+        line_edit.on_trait_change(lambda new: values.append(new), 'flag')
+        line_edit.qobj.setText(u'one')
+        line_edit.qobj.setText(u'two')
+        self.assertEqual(values, [])
+        self.event_loop_helper.event_loop_until_condition(lambda: values)
+        self.assertEqual(values, [u'two'])
+
+    def test_dispose_drops_pending(self):
+        slider, values = self.make_slider('valueChanged')
+        slider.qobj.setValue(1)
+        slider.dispose()
+        self.event_loop_helper.event_loop()
+        self.assertEqual(values, [])
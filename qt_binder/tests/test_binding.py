@@ -8,6 +8,8 @@
 #
 # Thanks for using Enthought open source!
 
+from concurrent.futures import ThreadPoolExecutor
+import threading
 import unittest
 
 import six
@@ -16,8 +18,12 @@ from traits.api import Any, Event, HasTraits, NO_COMPARE, \
     pop_exception_handler, push_exception_handler, Instance
 
 from ..binder import Binder
+from ..constants import SIGNAL_DISPATCHER
+from ..qt import QtGui
+from ..testing import BaseTestWithGui
 from ..binding import Binding, Factory, PulledFrom, PushedTo, SetOnceTo, \
-    SyncedWith, find_ext_attrs
+    SyncedWith, compile_expression, find_ext_attrs, get_binding_executor, \
+    set_binding_executor, split_binding_options
 
 
 class DummyBinder(Binder):
@@ -59,11 +65,22 @@ class TestBinding(unittest.TestCase):
             ('object.foo + "ohm.m"', ['object.foo']),
             ('object.foo + "ohm.m".format.__name__', ['object.foo']),
             ('(object.foo).text()', ['object.foo']),
+            ('( object.foo ).text.upper', ['object.foo']),
+            ('object . foo', ['object.foo']),
+            ('object.foo[0].bar', ['object.foo']),
+            ('object.items[object.index]', ['object.items', 'object.index']),
+            ('[x.y for x in object.foo]', ['x.y', 'object.foo']),
+            ('u"\u00e9" + object.foo', ['object.foo']),
         ]
         for expr, ext_attrs in pairs:
             found = find_ext_attrs(expr)
             six.assertCountEqual(self, found, ext_attrs)
 
+    def test_compile_expression(self):
+        code = compile_expression('object.y + 1')
+        self.assertIs(compile_expression('object.y + 1'), code)
+        self.assertEqual(eval(code, self.context), 11)
+
     def test_parse_binding(self):
         pairs = [
             ('text = object.text',
@@ -96,6 +113,10 @@ class TestBinding(unittest.TestCase):
              SyncedWith('value', 'object.value')),
             ('lineEdit.text << object.text',
              PulledFrom('lineEdit.text', 'object.text')),
+            ('value[debounce=200] >> object.value',
+             PushedTo('value[debounce=200]', 'object.value')),
+            ('value [throttle=50, latest_only]:=object.value',
+             SyncedWith('value [throttle=50, latest_only]', 'object.value')),
         ]
         for text, binding in pairs:
             parsed = Binding.parse(text)
@@ -171,6 +192,35 @@ class TestBinding(unittest.TestCase):
         self.binder.x = 30
         self.assertEqual(self.model.y, 20)
 
+    def test_split_binding_options(self):
+        self.assertEqual(split_binding_options('value'), ('value', {}))
+        self.assertEqual(split_binding_options('value[debounce=200]'),
+                         ('value', {'debounce': 200.0}))
+        self.assertEqual(
+            split_binding_options('slider.value [throttle=50, latest_only]'),
+            ('slider.value', {'throttle': 50.0, 'latest_only': True}))
+        self.assertEqual(split_binding_options('value[latest_only=False]'),
+                         ('value', {'latest_only': False}))
+        with self.assertRaises(ValueError):
+            split_binding_options('value[delay=200]')
+
+    def test_pushed_to_rate_limit(self):
+        binding = Binding.parse('x[debounce=200] >> object.y')
+        binding.bind(self.binder, self.context)
+        self.assertEqual(self.binder._rate_limit_for('x'), {'debounce': 200.0})
+        self.binder.x = 20
+        self.assertEqual(self.model.y, 20)
+        binding.unbind()
+        self.assertEqual(self.binder._rate_limit_for('x'), {})
+
+    def test_pushed_to_restores_instance_rate_limit(self):
+        self.binder.set_rate_limit('x', throttle=50)
+        binding = Binding.parse('x[debounce=200] >> object.y')
+        binding.bind(self.binder, self.context)
+        self.assertEqual(self.binder._rate_limit_for('x'), {'debounce': 200.0})
+        binding.unbind()
+        self.assertEqual(self.binder._rate_limit_for('x'), {'throttle': 50})
+
     def test_synced_with(self):
         binding = SyncedWith('x', 'object.y')
         binding.bind(self.binder, self.context)
@@ -185,6 +235,25 @@ class TestBinding(unittest.TestCase):
         self.binder.x = 35
         self.assertEqual(self.model.y, 30)
 
+    def test_synced_with_echo_suppressed(self):
+        pushed = []
+        self.model.on_trait_change(lambda new: pushed.append(new), 'y')
+        binding = SyncedWith('x', 'object.y')
+        binding.bind(self.binder, self.context)
+        self.model.y = 20
+        self.assertEqual(self.binder.x, 20)
+        # The binder's change was not written back to the model.
+        self.assertEqual(pushed, [20])
+        self.assertEqual(binding.echo_guard.n_suppressed, 1)
+        self.binder.x = 25
+        self.assertEqual(pushed, [20, 25])
+        self.assertEqual(binding.echo_guard.n_suppressed, 2)
+        # A value equal to an earlier transfer the other way is not an echo.
+        self.binder.x = 20
+        self.assertEqual(self.model.y, 20)
+        self.assertEqual(pushed, [20, 25, 20])
+        binding.unbind()
+
     def test_child(self):
         self.binder.child = DummyBinder()
         binding = SyncedWith('child.x', 'object.y')
@@ -210,3 +279,241 @@ class TestBinding(unittest.TestCase):
         binding.unbind()
         self.model.y = 30
         self.assertEqual(self.blah.x, 20)
+
+
+class GatedModel(HasTraits):
+    """ A model whose assignments block until the gate is opened.
+    """
+    y = Any(10, comparison_mode=NO_COMPARE)
+
+    def __init__(self, **traits):
+        super(GatedModel, self).__init__(**traits)
+        self.gate = threading.Event()
+        self.assigned = []
+
+    def _y_changed(self, new):
+        self.assigned.append((new, threading.current_thread()))
+        self.gate.wait(5.0)
+
+
+class TestThreadedBinding(BaseTestWithGui, unittest.TestCase):
+
+    def setUp(self):
+        BaseTestWithGui.setUp(self)
+        self.binder = DummyBinder()
+        self.model = GatedModel()
+        self.context = dict(object=self.model)
+
+    def tearDown(self):
+        self.model.gate.set()
+        BaseTestWithGui.tearDown(self)
+
+    def test_pushed_to_threaded(self):
+        binding = Binding.parse('x[threaded] >> object.y')
+        binding.bind(self.binder, self.context)
+        self.binder.x = 1
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.model.assigned)
+        # While 1 is being assigned, 2 is superseded by 3.
+        self.binder.x = 2
+        self.binder.x = 3
+        self.model.gate.set()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: len(self.model.assigned) == 2)
+        self.assertEqual([value for value, _ in self.model.assigned], [1, 3])
+        for _, thread in self.model.assigned:
+            self.assertIsNot(thread, threading.current_thread())
+        self.assertEqual(binding.pusher.n_dropped, 1)
+        binding.unbind()
+
+    def test_pushed_to_threaded_after_failed_submit(self):
+        binding = Binding.parse('x[threaded] >> object.y')
+        binding.bind(self.binder, self.context)
+        executor = get_binding_executor()
+        dead_executor = ThreadPoolExecutor(max_workers=1)
+        dead_executor.shutdown()
+        set_binding_executor(dead_executor)
+        try:
+            with self.assertRaises(RuntimeError):
+                binding.pusher.handler(1)
+        finally:
+            set_binding_executor(executor)
+        # The binding still works once values can be submitted again.
+        self.model.gate.set()
+        self.binder.x = 2
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.model.assigned)
+        self.assertEqual([value for value, _ in self.model.assigned], [2])
+        binding.unbind()
+
+    def test_synced_with_threaded(self):
+        binding = Binding.parse('x[threaded] := object.y')
+        binding.bind(self.binder, self.context)
+        self.assertEqual(self.binder.x, 10)
+        threads = []
+        self.binder.on_trait_change(
+            lambda: threads.append(threading.current_thread()), 'x')
+        self.binder.x = 1
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: self.model.assigned)
+        self.binder.x = 2
+        self.model.gate.set()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: len(self.model.assigned) == 2)
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: binding.echo_guard.n_suppressed == 1)
+        self.event_loop_helper.event_loop()
+        # The change back from the stale value 1 was dropped, and the one from
+        # 2 is an echo.
+        self.assertEqual(self.binder.x, 2)
+        self.assertEqual(binding.marshaled.n_dropped, 1)
+        self.assertEqual(len(threads), 2)
+        for thread in threads:
+            self.assertIs(thread, threading.current_thread())
+        # Changes echoed back by the worker are not pushed again.
+        self.assertEqual(len(self.model.assigned), 2)
+        binding.unbind()
+
+
+class TestCoalescedBinding(BaseTestWithGui, unittest.TestCase):
+
+    def setUp(self):
+        BaseTestWithGui.setUp(self)
+        self.binder = DummyBinder()
+        self.model = DummyModel()
+        self.context = dict(object=self.model)
+
+    def test_pulled_from_coalesced(self):
+        values = []
+        self.binder.on_trait_change(lambda new: values.append(new), 'x')
+        binding = Binding.parse('x[coalesce] << object.y * 2')
+        binding.bind(self.binder, self.context)
+        # The initial value is set immediately.
+        self.assertEqual(values, [20])
+        self.model.y = 1
+        self.model.y = 2
+        self.model.y = 3
+        self.assertEqual(values, [20])
+        self.event_loop_helper.event_loop()
+        self.assertEqual(values, [20, 6])
+        evaluator = binding.evaluator
+        self.assertEqual(evaluator.n_requested, 3)
+        self.assertEqual(evaluator.n_evaluated, 1)
+        self.assertEqual(evaluator.n_saved, 2)
+        binding.unbind()
+
+    def test_unbind_cancels_pending_evaluation(self):
+        binding = Binding.parse('x[coalesce] << object.y + 1')
+        binding.bind(self.binder, self.context)
+        self.model.y = 1
+        binding.unbind()
+        self.event_loop_helper.event_loop()
+        self.assertEqual(self.binder.x, 11)
+
+    def test_coalesce_single_attribute(self):
+        for text in ('x[coalesce] << object.y', 'x[coalesce] := object.y'):
+            binding = Binding.parse(text)
+            with self.assertRaises(ValueError):
+                binding.bind(self.binder, self.context)
+        # Nothing was bound.
+        self.model.y = 1
+        self.assertIsNone(self.binder.x)
+
+
+class Slider(Binder):
+    qclass = QtGui.QSlider
+
+
+class SpinBox(Binder):
+    qclass = QtGui.QSpinBox
+
+
+class LineEdit(Binder):
+    qclass = QtGui.QLineEdit
+
+
+class TestNativeConnection(BaseTestWithGui, unittest.TestCase):
+
+    def setUp(self):
+        BaseTestWithGui.setUp(self)
+        self.slider = Slider()
+        self.spin = SpinBox()
+        self.line_edit = LineEdit()
+        for binder in (self.slider, self.spin, self.line_edit):
+            binder.construct()
+        self.context = dict(slider=self.slider, spin=self.spin,
+                            line_edit=self.line_edit)
+
+    def tearDown(self):
+        for binder in (self.slider, self.spin, self.line_edit):
+            binder.dispose()
+        BaseTestWithGui.tearDown(self)
+
+    def connections(self, binder):
+        dispatcher = binder.__dict__.get(SIGNAL_DISPATCHER)
+        if dispatcher is None:
+            return {}
+        return dispatcher.connections
+
+    def test_pushed_to(self):
+        binding = Binding.parse('slider.value >> spin.value')
+        binding.bind(self.slider, self.context)
+        self.assertIsNotNone(binding.push_connection)
+        self.assertIsNone(binding.pusher)
+        self.slider.qobj.setValue(42)
+        self.assertEqual(self.spin.qobj.value(), 42)
+        # No Python slot was connected for the trait.
+        self.assertEqual(self.connections(self.slider), {})
+
+        # Listeners of the target are still notified.
+        values = []
+        self.spin.on_trait_change(lambda new: values.append(new), 'value')
+        self.slider.value = 43
+        self.assertEqual(values, [43])
+
+        binding.unbind()
+        self.slider.qobj.setValue(50)
+        self.assertEqual(self.spin.qobj.value(), 43)
+
+    def test_synced_with(self):
+        self.spin.qobj.setValue(7)
+        binding = Binding.parse('slider.value := spin.value')
+        binding.bind(self.slider, self.context)
+        # Synced traits go through Python, where echoes are suppressed.
+        self.assertIsNone(binding.pull_connection)
+        self.assertIsNone(binding.push_connection)
+        self.assertIsNotNone(binding.pusher)
+        self.assertEqual(self.slider.value, 7)
+        self.slider.qobj.setValue(20)
+        self.assertEqual(self.spin.qobj.value(), 20)
+        # The change of the spin box back to the slider is an echo.
+        self.assertEqual(binding.echo_guard.n_suppressed, 1)
+        self.spin.qobj.setValue(30)
+        self.assertEqual(self.slider.qobj.value(), 30)
+        self.assertEqual(binding.echo_guard.n_suppressed, 2)
+        binding.unbind()
+        self.spin.qobj.setValue(40)
+        self.assertEqual(self.slider.qobj.value(), 30)
+
+    def test_mismatched_types_fall_back(self):
+        binding = Binding.parse('slider.value >> line_edit.text')
+        binding.bind(self.slider, self.context)
+        self.assertIsNone(binding.push_connection)
+        self.assertIsNotNone(binding.pusher)
+        binding.unbind()
+
+    def test_options_fall_back(self):
+        binding = Binding.parse('slider.value[latest_only] >> spin.value')
+        binding.bind(self.slider, self.context)
+        self.assertIsNone(binding.push_connection)
+        binding.unbind()
+
+    def test_batched_target_falls_back(self):
+        binding = Binding.parse('slider.value >> spin.value')
+        with self.spin.batch():
+            binding.bind(self.slider, self.context)
+            self.assertIsNone(binding.push_connection)
+            self.slider.qobj.setValue(42)
+            self.assertEqual(self.spin.qobj.value(), 0)
+        self.assertEqual(self.spin.qobj.value(), 42)
+        binding.unbind()
@@ -0,0 +1,118 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from .. import introspection
+from ..binder import Binder, QtGetterSetter, QtProperty, QtSignal, QtSlot
+from ..introspection import IntrospectionCache, QtClassInfo, \
+    get_cache_directory, get_class_info, get_method_names, \
+    set_cache_directory
+from ..qt import QtCore, QtGui
+
+
+class TestIntrospectionCache(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QtGui.QApplication.instance()
+        if self.app is None:
+            self.app = QtGui.QApplication([])
+        self.tmpdir = tempfile.mkdtemp()
+        self.old_directory = get_cache_directory()
+        self.old_class_infos = introspection._class_infos.copy()
+        introspection._class_infos.clear()
+        set_cache_directory(self.tmpdir)
+
+    def tearDown(self):
+        set_cache_directory(self.old_directory)
+        introspection._class_infos.clear()
+        introspection._class_infos.update(self.old_class_infos)
+        shutil.rmtree(self.tmpdir)
+
+    def test_json_round_trip(self):
+        info = QtClassInfo.from_qclass(QtCore.QTimer)
+        copy = QtClassInfo.from_json(info.to_json())
+        self.assertEqual(copy.properties, info.properties)
+        self.assertEqual(copy.methods, info.methods)
+        self.assertEqual(copy.getter_setters, info.getter_setters)
+
+    def test_persisted(self):
+        info = get_class_info(QtCore.QTimer)
+        cache = IntrospectionCache(self.tmpdir)
+        self.assertTrue(os.path.exists(cache.path_for(QtCore.QTimer)))
+
+        # A new process would load the entry instead of introspecting.
+        introspection._class_infos.clear()
+        loaded = cache.load(QtCore.QTimer)
+        self.assertEqual(loaded.properties, info.properties)
+        self.assertEqual(loaded.methods, info.methods)
+        self.assertEqual(loaded.getter_setters, info.getter_setters)
+
+    def test_corrupt_entry_ignored(self):
+        cache = IntrospectionCache(self.tmpdir)
+        path = cache.path_for(QtCore.QTimer)
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as f:
+            f.write('{not json')
+        self.assertIsNone(cache.load(QtCore.QTimer))
+        info = get_class_info(QtCore.QTimer)
+        self.assertEqual(cache.load(QtCore.QTimer).methods, info.methods)
+
+    def test_python_subclass_not_persisted(self):
+        class Timer(QtCore.QTimer):
+            pass
+
+        get_class_info(Timer)
+        cache = IntrospectionCache(self.tmpdir)
+        self.assertFalse(os.path.exists(cache.path_for(Timer)))
+
+    def test_binder_from_cache(self):
+        get_class_info(QtCore.QTimer)
+        introspection._class_infos.clear()
+
+        class Timer(Binder):
+            qclass = QtCore.QTimer
+
+        Timer()
+        traits = {k: v.trait_type for k, v in Timer.class_traits().items()}
+        self.assertIsInstance(traits['deleteLater'], QtSlot)
+        self.assertIsInstance(traits['timeout'], QtSignal)
+        self.assertIsInstance(traits['interval'], QtProperty)
+        self.assertIsInstance(traits['parent'], QtGetterSetter)
+
+    def test_incremental_introspection(self):
+        # Reusing the information of the Qt base classes gives the same result
+        # as introspecting everything.
+        info = get_class_info(QtGui.QLineEdit)
+        self.assertIn(QtGui.QWidget, introspection._class_infos)
+        full = QtClassInfo.from_qclass(QtGui.QLineEdit)
+        self.assertEqual(info.properties, full.properties)
+        self.assertEqual(info.methods, full.methods)
+        self.assertEqual(info.getter_setters, full.getter_setters)
+
+    def test_method_names(self):
+        names = get_method_names(QtGui.QLineEdit)
+        self.assertIs(get_method_names(QtGui.QLineEdit), names)
+        self.assertIn(QtGui.QWidget, introspection._method_names)
+        self.assertIn('setText', names)
+        self.assertIn('setParent', names)
+        self.assertLessEqual(get_method_names(QtGui.QWidget), names)
+        # Methods of non-QObject bases are included.
+        self.assertIn('setAlignment', get_method_names(QtGui.QBoxLayout))
+
+    def test_getter_setters(self):
+        info = get_class_info(QtGui.QLineEdit)
+        pairs = set(info.getter_setters)
+        self.assertIn(('text', 'setText'), pairs)
+        self.assertIn(('parent', 'setParent'), pairs)
+        self.assertNotIn(('property', 'setProperty'), pairs)
@@ -8,6 +8,8 @@
 #
 # Thanks for using Enthought open source!
 
+import collections
+import threading
 import unittest
 
 from ..type_registry import LazyRegistry
@@ -56,3 +58,71 @@ class TestLazyRegistry(unittest.TestCase):
                          'Imported foo:Abstract')
         self.assertEqual(self.registry.lookup_by_type(ConcreteSubclass),
                          'Imported foo:Abstract')
+
+    def test_memoized_import(self):
+        imported = []
+
+        def import_object(mod_object):
+            imported.append(mod_object)
+            return 'Imported {0}'.format(mod_object)
+
+        self.registry._import_object = import_object
+        self.registry.push(A, 'foo:A')
+        self.assertEqual(self.registry.lookup_by_type(A), 'Imported foo:A')
+        self.assertEqual(self.registry.lookup_by_type(B), 'Imported foo:A')
+        self.assertEqual(imported, ['foo:A'])
+
+        # Popping forgets the imported object.
+        self.registry.push(A, 'foo:A2')
+        self.assertEqual(self.registry.lookup_by_type(A), 'Imported foo:A2')
+        self.assertEqual(self.registry.pop(A), 'foo:A2')
+        self.assertEqual(self.registry.lookup_by_type(A), 'Imported foo:A')
+        self.registry.pop(A)
+        self.registry.push(A, 'foo:A2')
+        self.assertEqual(self.registry.lookup_by_type(A), 'Imported foo:A2')
+        self.assertEqual(imported, ['foo:A', 'foo:A2', 'foo:A2'])
+
+    def test_resolve_all(self):
+        registry = LazyRegistry()
+        registry.push(A, 'collections:OrderedDict')
+        registry.push('dummies:D', 'collections:deque')
+        registry.push_abc(Abstract, 'no_such_module:Thing')
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(registry.resolve_all()))
+        thread.start()
+        thread.join()
+        failures, = results
+        self.assertEqual(list(failures), ['no_such_module:Thing'])
+        self.assertIsInstance(failures['no_such_module:Thing'], ImportError)
+        self.assertEqual(registry._imported, {
+            'collections:OrderedDict': collections.OrderedDict,
+            'collections:deque': collections.deque,
+        })
+        self.assertIs(registry.lookup_by_type(D), collections.deque)
+        self.assertRaises(ImportError, registry.lookup_by_type, Concrete)
+
+    def test_freeze(self):
+        registry = LazyRegistry()
+        registry.push(A, 'collections:OrderedDict')
+        registry.push('dummies:D', 'collections:deque')
+        registry.push(C, 'no_such_module:Thing')
+        frozen = registry.freeze()
+        self.assertIs(frozen._table[A], collections.OrderedDict)
+        self.assertIs(frozen.lookup_by_type(B), collections.OrderedDict)
+        self.assertIs(frozen.lookup_by_type(Mixed), collections.OrderedDict)
+        self.assertIs(frozen.lookup_by_type(D), collections.deque)
+        self.assertEqual(frozen.lookup_all_by_type(D), ('collections:deque',))
+        self.assertRaises(ImportError, frozen.lookup_by_type, C)
+
+    def test_freeze_failed_import(self):
+        def import_object(mod_object):
+            raise RuntimeError('Error importing {0}'.format(mod_object))
+
+        registry = LazyRegistry()
+        registry._import_object = import_object
+        registry.push(A, 'broken:Thing')
+        # Any error is left to raise when the type is looked up.
+        frozen = registry.freeze()
+        self.assertRaises(RuntimeError, frozen.lookup_by_type, A)
+        self.assertRaises(RuntimeError, frozen.lookup_by_type, B)
@@ -0,0 +1,82 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from ..binder import Binder, QtDynamicProperty
+from ..qt import QtGui
+from ..restyle import RestyleScheduler, restyle_scheduler
+from ..testing import BaseTestWithGui
+
+
+class Label(Binder):
+    qclass = QtGui.QLabel
+
+    flag = QtDynamicProperty(False)
+
+
+class PolishCountingStyle(QtGui.QCommonStyle):
+
+    def __init__(self):
+        super(PolishCountingStyle, self).__init__()
+        self.polished = []
+
+    def polish(self, *args):
+        if isinstance(args[0], QtGui.QWidget):
+            self.polished.append(args[0])
+        return super(PolishCountingStyle, self).polish(*args)
+
+
+class TestRestyleScheduler(BaseTestWithGui, unittest.TestCase):
+
+    def setUp(self):
+        BaseTestWithGui.setUp(self)
+        self.style = PolishCountingStyle()
+        restyle_scheduler.flush()
+        restyle_scheduler.reset_counters()
+
+    def make_label(self):
+        label = Label()
+        label.construct()
+        label.qobj.setStyle(self.style)
+        del self.style.polished[:]
+        return label
+
+    def test_coalesced(self):
+        labels = [self.make_label() for i in range(3)]
+        self.event_loop_helper.event_loop()
+        del self.style.polished[:]
+        restyle_scheduler.reset_counters()
+        for i in range(4):
+            for label in labels:
+                label.flag = not label.flag
+        self.assertEqual(self.style.polished, [])
+        self.assertEqual(restyle_scheduler.n_saved, 9)
+
+        self.event_loop_helper.event_loop()
+        self.assertEqual(self.style.polished,
+                         [label.qobj for label in labels])
+        self.assertEqual(restyle_scheduler.n_requested, 12)
+        self.assertEqual(restyle_scheduler.n_polished, 3)
+        self.assertEqual(restyle_scheduler.n_saved, 9)
+
+        # A later change is polished again.
+        labels[0].flag = True
+        self.event_loop_helper.event_loop()
+        self.assertEqual(len(self.style.polished), 4)
+
+    def test_disabled(self):
+        scheduler = RestyleScheduler()
+        scheduler.enabled = False
+        label = self.make_label()
+        scheduler.schedule(label.qobj)
+        scheduler.schedule(label.qobj)
+        self.assertEqual(self.style.polished, [label.qobj, label.qobj])
+        self.assertEqual(scheduler.n_saved, 0)
@@ -0,0 +1,114 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from traits.api import Str
+
+from .. import static_traits
+from ..binder import Binder, QtGetterSetter, QtProperty, QtSignal, QtSlot
+from ..qt import QtCore, QtGui
+from ..static_traits import get_static_traits_package, main, \
+    module_name_for, set_static_traits_package, write_modules
+
+
+# Module-level classes so that the generated modules can be found by name.
+class Timer(Binder):
+    qclass = QtCore.QTimer
+
+
+class Label(Binder):
+    qclass = QtGui.QLabel
+
+    text = Str()
+
+
+def introspection_forbidden(qclass):
+    raise AssertionError('{0} was introspected'.format(qclass.__name__))
+
+
+class TestStaticTraits(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QtGui.QApplication.instance()
+        if self.app is None:
+            self.app = QtGui.QApplication([])
+        self.tmpdir = tempfile.mkdtemp()
+        self.package = 'qt_binder_test_static_traits'
+        self.package_dir = os.path.join(self.tmpdir, self.package)
+        sys.path.insert(0, self.tmpdir)
+        self.old_package = get_static_traits_package()
+        set_static_traits_package(self.package)
+
+    def tearDown(self):
+        set_static_traits_package(self.old_package)
+        sys.path.remove(self.tmpdir)
+        for name in list(sys.modules):
+            if name.split('.')[0] == self.package:
+                del sys.modules[name]
+        shutil.rmtree(self.tmpdir)
+
+    def make_binder_class(self, base):
+        # A fresh subclass that has not been initialized yet.
+        return type(base.__name__, (base,), {'__module__': __name__})
+
+    def test_load_without_introspection(self):
+        write_modules([Timer], self.package_dir)
+        binder_class = self.make_binder_class(Timer)
+        # Generated modules are looked up by the name of the class.
+        self.assertEqual(module_name_for(binder_class),
+                         module_name_for(Timer))
+
+        from .. import binder
+        old_get_class_info = binder.get_class_info
+        binder.get_class_info = introspection_forbidden
+        try:
+            binder_class()
+        finally:
+            binder.get_class_info = old_get_class_info
+        traits = {k: v.trait_type
+                  for k, v in binder_class.class_traits().items()}
+        self.assertIsInstance(traits['deleteLater'], QtSlot)
+        self.assertIsInstance(traits['timeout'], QtSignal)
+        self.assertIsInstance(traits['interval'], QtProperty)
+        self.assertIsInstance(traits['parent'], QtGetterSetter)
+
+    def test_declared_traits_kept(self):
+        main(['-o', self.package_dir, __name__ + ':Label'])
+        binder_class = self.make_binder_class(Label)
+        binder_class()
+        self.assertIsInstance(binder_class.class_traits()['text'].trait_type,
+                              Str)
+        self.assertIsInstance(
+            binder_class.class_traits()['wordWrap'].trait_type, QtProperty)
+
+    def test_mismatched_header_falls_back(self):
+        write_modules([Timer], self.package_dir)
+        path = os.path.join(self.package_dir,
+                            module_name_for(Timer) + '.py')
+        with open(path) as f:
+            source = f.read()
+        with open(path, 'w') as f:
+            f.write(source.replace(
+                "'qt_version': '{0}'".format(QtCore.qVersion()),
+                "'qt_version': '0.0.0'"))
+        self.assertIsNone(
+            static_traits.load_static_qt_traits(Timer, {}))
+
+        binder_class = self.make_binder_class(Timer)
+        binder_class()
+        self.assertIn('timeout', binder_class.class_traits())
+
+    def test_missing_module_falls_back(self):
+        self.assertIsNone(static_traits.load_static_qt_traits(Timer, {}))
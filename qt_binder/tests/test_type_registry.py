@@ -8,6 +8,8 @@
 #
 # Thanks for using Enthought open source!
 
+import abc
+import gc
 import unittest
 
 from ..type_registry import TypeRegistry
@@ -124,3 +126,175 @@ class TestTypeRegistry(unittest.TestCase):
         self.assertEqual(self.registry.type_map, {})
         self.assertEqual(self.registry.name_map, {})
         self.assertEqual(self.registry.abc_map, {})
+
+    def test_resolution_cache(self):
+        self.registry.push(A, 'A')
+        self.assertEqual(self.registry.lookup_by_type(C), 'A')
+        self.assertIn(C, self.registry._resolved)
+        # Pushing onto an existing stack keeps the resolution.
+        self.registry.push(A, 'A2')
+        self.assertIn(C, self.registry._resolved)
+        self.assertEqual(self.registry.lookup_by_type(C), 'A2')
+
+        # A new registration for a class in the MRO invalidates it.
+        self.registry.push('dummies:B', 'B')
+        self.assertNotIn(C, self.registry._resolved)
+        self.assertEqual(self.registry.lookup_by_type(C), 'B')
+        self.registry.push(C, 'C')
+        self.assertEqual(self.registry.lookup_by_type(C), 'C')
+        self.assertEqual(self.registry.lookup_by_type(A), 'A2')
+
+        # So does depleting the stack it resolved to.
+        self.registry.pop(C)
+        self.assertEqual(self.registry.lookup_by_type(C), 'B')
+        self.registry.pop(B)
+        self.assertEqual(self.registry.lookup_by_type(C), 'A2')
+        self.registry.pop(A)
+        self.registry.pop(A)
+        self.assertRaises(KeyError, self.registry.lookup_by_type, C)
+        self.assertEqual(len(self.registry._resolved), 0)
+
+    def test_resolution_cache_name_index(self):
+        self.registry.push(A, 'A')
+        self.registry.push(D, 'D')
+        self.registry.lookup_by_type(C)
+        self.registry.lookup_by_type(D)
+        self.assertEqual(set(self.registry._resolved_by_name['dummies:B']),
+                         {C})
+        self.assertEqual(
+            set(self.registry._resolved_by_name['builtins:object']), {C, D})
+
+        # Only the subclasses of the newly registered class are dropped.
+        self.registry.push('dummies:B', 'B')
+        self.assertNotIn(C, self.registry._resolved)
+        self.assertIn(D, self.registry._resolved)
+        self.assertNotIn('dummies:B', self.registry._resolved_by_name)
+        self.assertEqual(self.registry.lookup_by_type(C), 'B')
+        self.registry.push(C, 'C')
+        self.assertNotIn(C, self.registry._resolved)
+        self.assertIn(D, self.registry._resolved)
+        self.assertEqual(self.registry.lookup_by_type(C), 'C')
+
+    def test_resolution_cache_stack_index(self):
+        self.registry.push(A, 'A')
+        self.registry.push(D, 'D')
+        self.registry.push_abc(Abstract, 'Abstract')
+        for typ in (B, C, D, Concrete):
+            self.registry.lookup_by_type(typ)
+        a_stack = id(self.registry.type_map[A])
+        abc_stack = id(self.registry.abc_map[Abstract])
+        self.assertEqual(set(self.registry._resolved_by_stack[a_stack]),
+                         {B, C})
+        self.assertEqual(set(self.registry._resolved_by_stack[abc_stack]),
+                         {Concrete})
+
+        # Depleting a stack only drops the types resolved to it.
+        self.registry.pop(A)
+        self.assertNotIn(a_stack, self.registry._resolved_by_stack)
+        self.assertNotIn(B, self.registry._resolved)
+        self.assertNotIn(C, self.registry._resolved)
+        self.assertIn(D, self.registry._resolved)
+        self.assertIn(Concrete, self.registry._resolved)
+
+        # So does registering a virtual subclass of any ABC.
+        Virtual = type('Virtual', (object,), {})
+        abc.ABCMeta('Unrelated', (object,), {}).register(Virtual)
+        self.registry.lookup_by_type(D)
+        self.assertNotIn(Concrete, self.registry._resolved)
+        self.assertIn(D, self.registry._resolved)
+
+    def test_resolution_cache_indexes_emptied(self):
+        self.registry.push(A, 'A')
+        for typ in (A, B, C):
+            self.registry.lookup_by_type(typ)
+        # Forgotten types leave no entries under any of their keys.
+        self.registry.push('dummies:B', 'B')
+        self.assertEqual(set(self.registry._resolved_by_name),
+                         {'dummies:A', 'builtins:object'})
+        self.registry.pop(A)
+        self.assertEqual(self.registry._resolved_by_name, {})
+        self.assertEqual(self.registry._resolved_by_stack, {})
+
+    def test_resolution_cache_weak(self):
+        self.registry.push(A, 'A')
+        Temporary = type('Temporary', (A,), {})
+        self.assertEqual(self.registry.lookup_by_type(Temporary), 'A')
+        self.assertEqual(len(self.registry._resolved), 1)
+        del Temporary
+        gc.collect()
+        self.assertEqual(len(self.registry._resolved), 0)
+
+    def test_resolution_cache_abc(self):
+        self.registry.push_abc(Abstract, 'Abstract')
+        self.assertEqual(self.registry.lookup_by_type(ConcreteSubclass),
+                         'Abstract')
+        self.registry.push(Concrete, 'Concrete')
+        self.assertEqual(self.registry.lookup_by_type(ConcreteSubclass),
+                         'Concrete')
+        self.registry.pop(Concrete)
+        self.assertEqual(self.registry.lookup_by_type(ConcreteSubclass),
+                         'Abstract')
+
+    def test_resolution_cache_abc_register(self):
+        First = abc.ABCMeta('First', (object,), {})
+        Second = abc.ABCMeta('Second', (object,), {})
+        Virtual = type('Virtual', (object,), {})
+        self.registry.push_abc(First, 'First')
+        self.registry.push_abc(Second, 'Second')
+        Second.register(Virtual)
+        self.assertEqual(self.registry.lookup_by_type(Virtual), 'Second')
+        # The ABCs are checked in registration order.
+        First.register(Virtual)
+        self.assertEqual(self.registry.lookup_by_type(Virtual), 'First')
+
+    def test_name_index(self):
+        self.registry.push('dummies:A', 'A1')
+        self.assertEqual(self.registry._types_by_name, {})
+        # The lookup moves the entry to the type map and indexes it.
+        self.assertEqual(self.registry.lookup_by_type(A), 'A1')
+        self.assertEqual(self.registry._types_by_name, {'dummies:A': [A]})
+        self.assertEqual(self.registry._name_by_type, {A: 'dummies:A'})
+        self.registry.push('dummies:A', 'A2')
+        self.assertEqual(self.registry.type_map, {A: ['A1', 'A2']})
+        self.assertEqual(self.registry.name_map, {})
+        self.registry.pop('dummies:A')
+        self.registry.pop('dummies:A')
+        self.assertEqual(self.registry.type_map, {})
+        self.assertEqual(self.registry._types_by_name, {})
+        self.assertEqual(self.registry._name_by_type, {})
+
+    def test_name_index_same_name(self):
+        # Another class with the same '__module__:__name__'.
+        OtherA = type('A', (object,), {'__module__': 'dummies'})
+        self.registry.push(A, 'A')
+        self.registry.push(OtherA, 'OtherA')
+        # Names refer to the first registered type.
+        self.registry.push('dummies:A', 'A2')
+        self.assertEqual(self.registry.lookup_all_by_type(A), ['A', 'A2'])
+        self.registry.pop(A)
+        self.registry.pop(A)
+        self.assertEqual(self.registry.pop('dummies:A'), 'OtherA')
+        self.assertEqual(self.registry._types_by_name, {})
+
+    def test_freeze(self):
+        self.registry.push(A, 'A')
+        self.registry.push('dummies:C', 'C')
+        self.registry.push_abc(Abstract, 'Abstract')
+        self.registry.lookup_by_type(Concrete)
+        frozen = self.registry.freeze()
+        self.assertEqual(set(frozen._table), {A, Concrete})
+        self.assertEqual(frozen.lookup_by_type(A), 'A')
+        self.assertEqual(frozen.lookup(C()), 'C')
+        self.assertEqual(frozen.lookup_by_type(B), 'A')
+        self.assertEqual(frozen.lookup_by_type(ConcreteSubclass), 'Abstract')
+        self.assertEqual(frozen.lookup_all(B()), ('A',))
+        self.assertRaises(KeyError, frozen.lookup_by_type, D)
+        self.assertIn(B, frozen._table)
+
+        # The snapshot does not follow the registry.
+        self.registry.push(A, 'A2')
+        self.registry.push(B, 'B')
+        self.assertEqual(frozen.lookup_by_type(A), 'A')
+        self.assertEqual(frozen.lookup_by_type(B), 'A')
+        self.assertEqual(frozen.lookup_by_type(Mixed), 'A')
+        self.assertEqual(self.registry.lookup_by_type(B), 'B')
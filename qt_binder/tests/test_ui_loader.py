@@ -9,6 +9,8 @@
 # Thanks for using Enthought open source!
 
 import os
+import shutil
+import tempfile
 import unittest
 
 from pyface.ui.qt4.util.modal_dialog_tester import ModalDialogTester
@@ -18,7 +20,8 @@ from traits.api import HasStrictTraits, Instance, Int, Unicode, \
 from traitsui.api import View
 
 from ..bound_editor import Bound
-from ..qt import QtGui
+from ..qt import QtGui, ui_loader
+from ..qt.ui_loader import clear_ui_templates, get_ui_template, load_ui
 from ..widgets import IntSlider, TextField, UIFile
 
 
@@ -26,6 +29,33 @@ def localfile(filename):
     return os.path.join(os.path.dirname(__file__), filename)
 
 
+NESTED_UI = """<?xml version="1.0" encoding="UTF-8"?>
+<ui version="4.0">
+ <class>NestedForm</class>
+ <widget class="QWidget" name="NestedForm">
+  <layout class="QVBoxLayout" name="outerLayout">
+   <item>
+    <widget class="QGroupBox" name="groupBox">
+     <layout class="QVBoxLayout" name="_groupLayout">
+      <item>
+       <widget class="QLineEdit" name="nestedEdit"/>
+      </item>
+     </layout>
+    </widget>
+   </item>
+  </layout>
+  <action name="actionSave">
+   <property name="text">
+    <string>Save</string>
+   </property>
+  </action>
+ </widget>
+ <resources/>
+ <connections/>
+</ui>
+"""
+
+
 class TestUiLoader(unittest.TestCase, GuiTestAssistant):
 
     def setUp(self):
@@ -105,5 +135,89 @@ class TestUiLoader(unittest.TestCase, GuiTestAssistant):
         tester.open_and_run(when_opened=_test)
 
 
+class TestUiTemplates(unittest.TestCase):
+
+    def setUp(self):
+        self.app = QtGui.QApplication.instance()
+        if self.app is None:
+            self.app = QtGui.QApplication([])
+        clear_ui_templates()
+        self.tmpdir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        clear_ui_templates()
+        shutil.rmtree(self.tmpdir)
+
+    def test_template_reused(self):
+        ui, names = load_ui(localfile('form.ui'))
+        template = get_ui_template(localfile('form.ui'))
+        self.assertIsNotNone(template)
+        self.assertIs(get_ui_template(localfile('form.ui')), template)
+        self.assertEqual(sorted(names), ['lineEdit', 'widget'])
+        self.assertEqual(ui.objectName(), u'TestForm')
+
+        other, other_names = load_ui(localfile('form.ui'))
+        self.assertIsNot(other, ui)
+        self.assertEqual(other_names, names)
+        line_edit = other.findChild(QtGui.QLineEdit, u'lineEdit')
+        self.assertIsNotNone(line_edit)
+        self.assertIsNot(line_edit, ui.findChild(QtGui.QLineEdit,
+                                                 u'lineEdit'))
+
+    def test_changed_file_recompiled(self):
+        path = os.path.join(self.tmpdir, 'form.ui')
+        shutil.copy(localfile('form.ui'), path)
+        template = get_ui_template(path)
+        with open(path) as f:
+            source = f.read()
+        with open(path, 'w') as f:
+            f.write(source.replace('"lineEdit"', '"textField"'))
+        stat = os.stat(path)
+        os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+        self.assertIsNot(get_ui_template(path), template)
+        ui, names = load_ui(path)
+        self.assertEqual(sorted(names), ['textField', 'widget'])
+
+    def test_uncompilable_file_loaded_each_time(self):
+        def fail(path):
+            raise RuntimeError('no uic')
+
+        old_ui_source = ui_loader._ui_source
+        ui_loader._ui_source = fail
+        try:
+            self.assertIsNone(get_ui_template(localfile('form.ui')))
+            ui, names = load_ui(localfile('form.ui'))
+        finally:
+            ui_loader._ui_source = old_ui_source
+        self.assertEqual(sorted(names), ['lineEdit', 'widget'])
+        self.assertIsNotNone(ui.findChild(QtGui.QLineEdit, u'lineEdit'))
+
+    def test_pyqt_names_from_children(self):
+        # PyQt binds the named direct children of the root widget, actions
+        # included, and not the widgets nested in them.
+        path = os.path.join(self.tmpdir, 'nested.ui')
+        with open(path, 'w') as f:
+            f.write(NESTED_UI)
+        source = ui_loader._ui_source(path)
+
+        old_qt_api = ui_loader.qt_api
+        old_ui_source = ui_loader._ui_source
+        ui_loader.qt_api = 'pyqt5'
+        ui_loader._ui_source = lambda path: source
+        try:
+            ui, names = load_ui(path)
+        finally:
+            ui_loader.qt_api = old_qt_api
+            ui_loader._ui_source = old_ui_source
+        self.assertIsNone(get_ui_template(path).names)
+        self.assertEqual(sorted(names),
+                         ['actionSave', 'groupBox', 'outerLayout'])
+
+        clear_ui_templates()
+        ui, names = load_ui(path)
+        self.assertEqual(sorted(names),
+                         ['groupBox', 'nestedEdit', 'outerLayout'])
+
+
 if __name__ == '__main__':
     unittest.main()
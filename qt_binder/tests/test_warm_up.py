@@ -0,0 +1,112 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+import unittest
+
+from ..binder import Binder
+from ..qt import QtCore, QtGui
+from ..raw_widgets import LineEdit, Object
+from ..testing import BaseTestWithGui
+from ..warm_up import BinderWarmUp, registered_binder_classes, warm_up
+
+
+def make_binder_classes():
+    class Timer(Binder):
+        qclass = QtCore.QTimer
+
+    class Label(Binder):
+        qclass = QtGui.QLabel
+
+    class Slider(Binder):
+        qclass = QtGui.QSlider
+
+    return [Timer, Label, Slider]
+
+
+class TestBinderWarmUp(BaseTestWithGui, unittest.TestCase):
+
+    def test_registered_binder_classes(self):
+        binder_classes = registered_binder_classes()
+        self.assertIn(Object, binder_classes)
+        self.assertIn(LineEdit, binder_classes)
+
+    def test_warm_up(self):
+        binder_classes = make_binder_classes()
+        progress = []
+        warmer = BinderWarmUp(binder_classes=binder_classes, time_slice=0.0)
+        warmer.on_trait_change(lambda new: progress.append(new), 'progress')
+        # Nothing happens before the event loop runs.
+        warmer.start()
+        self.assertTrue(warmer.running)
+        self.assertNotIn('timeout', binder_classes[0].class_traits())
+
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: not warmer.running)
+        self.assertEqual(warmer.n_initialized, 3)
+        self.assertEqual(warmer.progress, 1.0)
+        self.assertEqual(progress, [1.0 / 3, 2.0 / 3, 1.0])
+        self.assertFalse(warmer.cancelled)
+        self.assertIn('timeout', binder_classes[0].class_traits())
+        self.assertIn('text', binder_classes[1].class_traits())
+        self.assertIn('value', binder_classes[2].class_traits())
+
+    def test_failed_class(self):
+        counts = []
+
+        class Broken(Binder):
+            qclass = QtGui.QLabel
+
+            @classmethod
+            def _initialize_binder_class(cls):
+                counts.append(warmer.n_initialized)
+                raise RuntimeError('broken')
+
+        binder_classes = make_binder_classes()
+        binder_classes.insert(1, Broken)
+        warmer = BinderWarmUp(binder_classes=binder_classes, time_slice=0.0)
+        warmer.start()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: not warmer.running)
+        # The class only counts once its initialization is over.
+        self.assertEqual(counts, [1])
+        self.assertEqual(warmer.failed, [Broken])
+        self.assertEqual(warmer.n_initialized, 4)
+        self.assertEqual(warmer.progress, 1.0)
+        self.assertIn('value', binder_classes[3].class_traits())
+
+    def test_cancel(self):
+        binder_classes = make_binder_classes()
+        warmer = BinderWarmUp(binder_classes=binder_classes, time_slice=0.0)
+        finished = []
+        warmer.on_trait_change(lambda: finished.append(True), 'finished')
+        warmer.start()
+        warmer.run_slice()
+        warmer.cancel()
+        self.assertFalse(warmer.running)
+        self.assertTrue(warmer.cancelled)
+        self.assertEqual(warmer.n_initialized, 1)
+        self.event_loop_helper.event_loop()
+        self.assertEqual(warmer.n_initialized, 1)
+        self.assertEqual(finished, [])
+
+        # Resume where we left off.
+        warmer.start()
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: bool(finished))
+        self.assertEqual(warmer.n_initialized, 3)
+        self.assertFalse(warmer.cancelled)
+
+    def test_warm_up_function(self):
+        binder_classes = make_binder_classes()
+        warmer = warm_up(binder_classes)
+        self.assertTrue(warmer.running)
+        self.event_loop_helper.event_loop_until_condition(
+            lambda: not warmer.running)
+        self.assertEqual(warmer.progress, 1.0)
@@ -8,6 +8,10 @@
 #
 # Thanks for using Enthought open source!
 
+import abc
+import threading
+import weakref
+
 import six
 
 
@@ -38,11 +42,42 @@ def _mod_name_key(typ):
     return key
 
 
+def _add_to_index(index, key, typ):
+    """ Add a type to the weak set of an index entry.
+    """
+    types = index.get(key)
+    if types is None:
+        types = index[key] = weakref.WeakSet()
+    types.add(typ)
+
+
+def _remove_from_index(index, key, typ):
+    """ Remove a type from an index entry, deleting the entry if it is left
+    empty.
+    """
+    types = index.get(key)
+    if types is not None:
+        types.discard(typ)
+        if not types:
+            del index[key]
+
+
+def _drop_if_empty(index, key):
+    """ Delete an index entry whose types have all been collected.
+    """
+    types = index.get(key)
+    if types is not None and not types:
+        del index[key]
+
+
 class TypeRegistry(object):
     """ Register objects for types.
 
     Each type maintains a stack of registered objects that can be pushed and
     popped.
+
+    Lookups are cached by type. The types resolved through the ABCs are
+    looked up again after any ``ABCMeta.register()`` call.
     """
 
     def __init__(self):
@@ -56,6 +91,33 @@ class TypeRegistry(object):
         # Map abstract base classes to lists of registered objects.
         self.abc_map = {}
 
+        # Index the types in the type map by their '__module__:__name__' key,
+        # in registration order, and the other way around.
+        self._types_by_name = {}
+        self._name_by_type = {}
+
+        # Map looked up types to the list of registered objects they resolved
+        # to. The lists are the ones in the maps above, so pushing onto an
+        # existing stack keeps them current. Only registering a new key or
+        # depleting a stack invalidates entries. The types are weakly held,
+        # so that classes created on the fly can be collected.
+        self._resolved = weakref.WeakKeyDictionary()
+
+        # Index the resolved types by the '__module__:__name__' keys of the
+        # classes in their MRO, so that a new registration only visits the
+        # entries it can change.
+        self._resolved_by_name = {}
+
+        # Index the resolved types by the id of the stack they resolved to,
+        # so that depleting a stack only visits its own entries. A stack is
+        # only dropped when it is depleted, which also drops its entry.
+        self._resolved_by_stack = {}
+
+        # The ABC cache token when the types resolved through the ABCs were
+        # resolved. ABCMeta.register() changes it, and such a virtual
+        # subclass may then resolve to another ABC.
+        self._abc_cache_token = abc.get_cache_token()
+
     #### TypeRegistry public interface ########################################
 
     def push(self, typ, obj):
@@ -70,17 +132,18 @@ class TypeRegistry(object):
         """
         if isinstance(typ, six.string_types):
             # Check the cached types.
-            for cls in self.type_map:
-                if _mod_name_key(cls) == typ:
-                    self.type_map[cls].append(obj)
-                    break
+            types = self._types_by_name.get(typ)
+            if types:
+                self.type_map[types[0]].append(obj)
             else:
                 if typ not in self.name_map:
                     self.name_map[typ] = []
+                    self._forget_subclasses_of_name(typ)
                 self.name_map[typ].append(obj)
         else:
             if typ not in self.type_map:
-                self.type_map[typ] = []
+                self._add_type(typ, [])
+                self._forget_subclasses_of(typ)
             self.type_map[typ].append(obj)
 
     def push_abc(self, typ, obj):
@@ -93,6 +156,8 @@ class TypeRegistry(object):
         obj : object
             The object to register.
         """
+        # A new ABC is checked after the concrete superclasses and the ABCs
+        # registered before it, so it does not change any resolved type.
         if typ not in self.abc_map:
             self.abc_map[typ] = []
         self.abc_map[typ].append(obj)
@@ -116,14 +181,11 @@ class TypeRegistry(object):
         """
         if isinstance(typ, six.string_types):
             if typ not in self.name_map:
-                # We may have it cached in the type map. We will have to
-                # iterate over all of the types to check.
-                for cls in self.type_map:
-                    if _mod_name_key(cls) == typ:
-                        old = self._pop_value(self.type_map, cls)
-                        break
-                else:
+                # We may have it cached in the type map.
+                types = self._types_by_name.get(typ)
+                if not types:
                     raise KeyError("No registered value for {0!r}".format(typ))
+                old = self._pop_value(self.type_map, types[0])
             else:
                 old = self._pop_value(self.name_map, typ)
         else:
@@ -214,6 +276,33 @@ class TypeRegistry(object):
         ------
         `KeyError` if the type has not been registered.
         """
+        if (self.abc_map and
+                abc.get_cache_token() != self._abc_cache_token):
+            self._forget_resolved_to_abcs()
+        objs = self._resolved.get(typ)
+        if objs is None:
+            objs = self._resolved[typ] = self._resolve(typ)
+            for cls in get_mro(typ):
+                _add_to_index(self._resolved_by_name, _mod_name_key(cls), typ)
+            _add_to_index(self._resolved_by_stack, id(objs), typ)
+        return objs
+
+    def freeze(self):
+        """ Take a read-only snapshot of the registry for fast lookups.
+
+        Returns
+        -------
+        frozen : FrozenTypeRegistry
+            The snapshot. Later changes to this registry do not affect it.
+        """
+        return FrozenTypeRegistry(self)
+
+    #### Private implementation ###############################################
+
+    def _resolve(self, typ):
+        """ Find the list of registered objects for a type, without the
+        resolution cache.
+        """
         # If a concrete superclass is registered use it.
         for cls in get_mro(typ):
             if cls in self.type_map or self._in_name_map(cls):
@@ -229,8 +318,6 @@ class TypeRegistry(object):
         # If we have reached here, the lookup failed.
         raise KeyError("No registered value for {0!r}".format(typ))
 
-    #### Private implementation ###############################################
-
     def _pop_value(self, mapping, key):
         """ Pop a value from a keyed stack in a mapping, taking care to remove
         the key if the stack is depleted.
@@ -238,9 +325,77 @@ class TypeRegistry(object):
         objs = mapping[key]
         old = objs.pop()
         if not objs:
-            del mapping[key]
+            if mapping is self.type_map:
+                self._remove_type(key)
+            else:
+                del mapping[key]
+            self._forget_resolved_to(objs)
         return old
 
+    def _add_type(self, typ, objs):
+        """ Add a stack to the type map and index it by name.
+        """
+        self.type_map[typ] = objs
+        key = _mod_name_key(typ)
+        self._name_by_type[typ] = key
+        self._types_by_name.setdefault(key, []).append(typ)
+
+    def _remove_type(self, typ):
+        """ Remove a stack from the type map and its name index.
+        """
+        del self.type_map[typ]
+        key = self._name_by_type.pop(typ)
+        types = self._types_by_name[key]
+        types.remove(typ)
+        if not types:
+            del self._types_by_name[key]
+
+    def _forget_subclasses_of(self, typ):
+        """ Drop the resolved types that a new registration for a type can
+        change.
+        """
+        key = _mod_name_key(typ)
+        for cls in list(self._resolved_by_name.get(key, ())):
+            # Other classes may have the same name.
+            if typ in get_mro(cls):
+                self._forget(cls)
+        _drop_if_empty(self._resolved_by_name, key)
+
+    def _forget_subclasses_of_name(self, key):
+        """ Drop the resolved types that a new registration for a
+        '__module__:__name__' key can change.
+        """
+        for cls in list(self._resolved_by_name.get(key, ())):
+            self._forget(cls)
+        _drop_if_empty(self._resolved_by_name, key)
+
+    def _forget_resolved_to(self, objs):
+        """ Drop the types resolved to a stack, e.g. a depleted one.
+        """
+        for cls in list(self._resolved_by_stack.get(id(objs), ())):
+            self._forget(cls)
+        _drop_if_empty(self._resolved_by_stack, id(objs))
+
+    def _forget(self, cls):
+        """ Drop a resolved type and its index entries, deleting the entries
+        that are left empty.
+        """
+        objs = self._resolved.pop(cls, None)
+        if objs is None:
+            return
+        _remove_from_index(self._resolved_by_stack, id(objs), cls)
+        for base in get_mro(cls):
+            _remove_from_index(self._resolved_by_name, _mod_name_key(base),
+                               cls)
+
+    def _forget_resolved_to_abcs(self):
+        """ Drop the types resolved through the ABCs, which virtual
+        subclasses registered since may resolve differently.
+        """
+        self._abc_cache_token = abc.get_cache_token()
+        for objs in self.abc_map.values():
+            self._forget_resolved_to(objs)
+
     def _in_name_map(self, typ):
         """ Check if the given type is specified in the name map.
 
@@ -257,12 +412,101 @@ class TypeRegistry(object):
         """
         key = _mod_name_key(typ)
         if key in self.name_map:
-            self.type_map[typ] = self.name_map.pop(key)
+            self._add_type(typ, self.name_map.pop(key))
             return True
         else:
             return False
 
 
+class FrozenTypeRegistry(object):
+    """ A read-only snapshot of a :class:`TypeRegistry`.
+
+    The registered objects of all of the types known to the registry when it
+    was frozen are computed into a flat table, so looking them up is a single
+    dict probe. Other types are resolved through their MRO and the ABCs once,
+    then added to the table. The snapshot can be shared across threads.
+    Virtual subclasses registered with ``ABCMeta.register()`` after a type is
+    in the table do not change its objects.
+    """
+
+    def __init__(self, registry, resolve_object=None):
+        # A private copy of the registry to resolve new types with.
+        snapshot = TypeRegistry()
+        for typ, objs in registry.type_map.items():
+            snapshot._add_type(typ, list(objs))
+        snapshot.name_map = {key: list(objs)
+                             for key, objs in registry.name_map.items()}
+        snapshot.abc_map = {typ: list(objs)
+                            for typ, objs in registry.abc_map.items()}
+        self._registry = snapshot
+
+        # Turns a registered object into the looked up one, if given.
+        self._resolve_object = resolve_object
+
+        # Guards the snapshot while new types are resolved. Lookups of known
+        # types do not take it.
+        self._lock = threading.Lock()
+
+        # Map types to their registered object and to all of them.
+        self._table = {}
+        self._all_table = {}
+
+        for typ in list(registry.type_map) + list(registry._resolved):
+            if typ not in self._table:
+                try:
+                    self._add(typ)
+                except Exception:
+                    # Leave a failed import to raise when it is looked up.
+                    pass
+
+    def lookup(self, instance):
+        """ Look up the registered object for the given instance.
+        """
+        return self.lookup_by_type(type(instance))
+
+    def lookup_by_type(self, typ):
+        """ Look up the registered object for a type.
+
+        Raises
+        ------
+        `KeyError` if the type has not been registered.
+        """
+        try:
+            return self._table[typ]
+        except KeyError:
+            return self._add(typ)
+
+    def lookup_all(self, instance):
+        """ Look up all the registered objects for the given instance.
+        """
+        return self.lookup_all_by_type(type(instance))
+
+    def lookup_all_by_type(self, typ):
+        """ Look up all the registered objects for a type, as a tuple.
+
+        Raises
+        ------
+        `KeyError` if the type has not been registered.
+        """
+        try:
+            return self._all_table[typ]
+        except KeyError:
+            self._add(typ)
+            return self._all_table[typ]
+
+    def _add(self, typ):
+        """ Resolve a type and add it to the tables.
+        """
+        with self._lock:
+            objs = tuple(self._registry.lookup_all_by_type(typ))
+            obj = objs[-1]
+            if self._resolve_object is not None:
+                obj = self._resolve_object(obj)
+            self._all_table[typ] = objs
+            self._table[typ] = obj
+        return obj
+
+
 class LazyRegistry(TypeRegistry):
     """ A type registry that will lazily import the registered objects.
 
@@ -270,13 +514,70 @@ class LazyRegistry(TypeRegistry):
     These will only be imported when the matching type is looked up. The module
     name must be a fully-qualified absolute name with all of the parent
     packages specified.
+
+    Each imported object is remembered, so looking it up again does not
+    import it again. Use :meth:`resolve_all` to do the imports ahead of time.
     """
 
+    def __init__(self):
+        super(LazyRegistry, self).__init__()
+
+        # Map '__module__:__name__' strings to the imported objects.
+        self._imported = {}
+
+    def pop(self, typ):
+        """ Pop a registered object for the given type.
+
+        The imported object is forgotten too, so pushing the string again
+        imports it anew.
+        """
+        old = TypeRegistry.pop(self, typ)
+        self._imported.pop(old, None)
+        return old
+
     def lookup_by_type(self, typ):
         """ Look up the registered object for a type.
         """
         mod_name = TypeRegistry.lookup_by_type(self, typ)
-        return self._import_object(mod_name)
+        return self._resolve_object(mod_name)
+
+    def freeze(self):
+        """ Take a read-only snapshot of the registry for fast lookups.
+
+        The objects of the types known to the registry are imported now.
+        """
+        return FrozenTypeRegistry(self, resolve_object=self._resolve_object)
+
+    def resolve_all(self):
+        """ Import all of the registered objects now.
+
+        This can be called from a background thread at startup so that the
+        imports are done before they are looked up, as long as the imported
+        modules do not create any ``QObject`` when they are imported.
+
+        Returns
+        -------
+        failures : dict
+            The exceptions raised by the imports that failed, by their
+            '__module__:__name__' string. Looking these up raises again.
+        """
+        failures = {}
+        for mapping in (self.type_map, self.name_map, self.abc_map):
+            # Copy, as the registry may change on the GUI thread meanwhile.
+            for objs in list(mapping.values()):
+                for mod_name in list(objs):
+                    try:
+                        self._resolve_object(mod_name)
+                    except Exception as e:
+                        failures[mod_name] = e
+        return failures
+
+    def _resolve_object(self, mod_object):
+        try:
+            return self._imported[mod_object]
+        except KeyError:
+            obj = self._imported[mod_object] = self._import_object(mod_object)
+            return obj
 
     def _import_object(self, mod_object):
         module, name = mod_object.split(':')
@@ -0,0 +1,169 @@
+# (C) Copyright 2014-2022 Enthought, Inc., Austin, TX
+# All rights reserved.
+#
+# This software is provided without warranty under the terms of the BSD
+# license included in LICENSE.txt and may be redistributed only under
+# the conditions described in the aforementioned license. The license
+# is also available online at http://www.enthought.com/licenses/BSD.txt
+#
+# Thanks for using Enthought open source!
+
+""" Initialize :class:`~.Binder` classes ahead of time from the Qt event loop.
+
+The first instantiation of each :class:`~.Binder` class introspects its Qt
+class. :class:`~.BinderWarmUp` does that work in small time slices while the
+event loop is otherwise idle, e.g. while a splash screen is showing, so the
+user does not wait for it at their first interaction.
+"""
+
+import logging
+import time
+
+from traits.api import Bool, Event, Float, HasStrictTraits, Instance, Int, \
+    List, Property
+
+from .binder import Binder
+from .qt import QtCore
+
+
+logger = logging.getLogger(__name__)
+
+
+def registered_binder_classes(registry=None):
+    """ Return the :class:`~.Binder` classes registered in a registry.
+
+    Parameters
+    ----------
+    registry : TypeRegistry, optional
+        The registry to look through. Defaults to the
+        :data:`~.binder_registry`. Entries that are not :class:`~.Binder`
+        classes are ignored.
+    """
+    if registry is None:
+        from .raw_widgets import binder_registry as registry
+    binder_classes = []
+    for mapping in (registry.type_map, registry.name_map, registry.abc_map):
+        for objs in mapping.values():
+            for obj in objs:
+                if (isinstance(obj, type) and issubclass(obj, Binder) and
+                        obj not in binder_classes):
+                    binder_classes.append(obj)
+    return binder_classes
+
+
+class BinderWarmUp(HasStrictTraits):
+    """ Initialize :class:`~.Binder` classes in time slices.
+
+    Each slice is run from a zero-interval ``QTimer`` so that other events
+    are processed in between. Listen to :attr:`progress` to update a splash
+    screen and to :attr:`finished` to know when all of the classes are ready.
+    """
+
+    #: The Binder classes to initialize, in order.
+    binder_classes = List()
+
+    #: The approximate time budget of each slice, in milliseconds. At least
+    #: one class is initialized per slice.
+    time_slice = Float(10.0)
+
+    #: The number of classes that have been initialized so far, including
+    #: those that failed.
+    n_initialized = Int(0)
+
+    #: The classes whose initialization raised an exception.
+    failed = List()
+
+    #: The fraction of the classes that have been initialized.
+    progress = Property(Float, depends_on='n_initialized,binder_classes')
+
+    #: Whether the warm-up is currently scheduled on the event loop.
+    running = Bool(False)
+
+    #: Whether the warm-up was cancelled before it finished.
+    cancelled = Bool(False)
+
+    #: Fired when all of the classes have been initialized.
+    finished = Event()
+
+    #: The timer driving the time slices.
+    _timer = Instance(QtCore.QTimer)
+
+    def start(self):
+        """ Schedule the warm-up on the Qt event loop.
+        """
+        if self.running:
+            return
+        self.cancelled = False
+        self._timer = QtCore.QTimer()
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.run_slice)
+        self.running = True
+        self._timer.start()
+
+    def cancel(self):
+        """ Stop initializing classes.
+
+        The classes that were already initialized stay initialized. The
+        warm-up can be resumed with :meth:`start`.
+        """
+        if self.running:
+            self._stop()
+            self.cancelled = True
+
+    def run_slice(self):
+        """ Initialize classes until the time slice is used up.
+        """
+        deadline = time.perf_counter() + self.time_slice / 1000.0
+        while self.n_initialized < len(self.binder_classes):
+            binder_class = self.binder_classes[self.n_initialized]
+            try:
+                binder_class._initialize_binder_class()
+            except Exception:
+                # Move on so that we do not retry the same class forever.
+                logger.exception('Error initializing %r', binder_class)
+                self.failed.append(binder_class)
+            self.n_initialized += 1
+            if time.perf_counter() >= deadline:
+                break
+        if self.n_initialized >= len(self.binder_classes):
+            self._stop()
+            self.finished = True
+
+    #### Private protocol #####################################################
+
+    def _stop(self):
+        if self._timer is not None:
+            self._timer.stop()
+            self._timer.timeout.disconnect(self.run_slice)
+            self._timer = None
+        self.running = False
+
+    def _get_progress(self):
+        n = len(self.binder_classes)
+        if n == 0:
+            return 1.0
+        return min(self.n_initialized, n) / float(n)
+
+
+def warm_up(binder_classes=None, time_slice=10.0):
+    """ Start initializing Binder classes from the Qt event loop.
+
+    Parameters
+    ----------
+    binder_classes : list of Binder subclasses, optional
+        The classes to initialize. Defaults to all of the classes in the
+        :data:`~.binder_registry`.
+    time_slice : float, optional
+        The approximate time budget of each slice, in milliseconds.
+
+    Returns
+    -------
+    warm_up : BinderWarmUp
+        The running warm-up. Use it to follow the progress or to cancel.
+    """
+    if binder_classes is None:
+        binder_classes = registered_binder_classes()
+    warmer = BinderWarmUp(binder_classes=list(binder_classes),
+                          time_slice=time_slice)
+    warmer.start()
+    return warmer